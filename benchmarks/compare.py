@@ -0,0 +1,69 @@
+"""
+Compares two benchmark result files written by run.py and reports regressions.
+
+Usage (from the root of the repository):
+    python benchmarks/compare.py baseline.json results.json --threshold 0.1
+
+Exits with status 1 if any metric got worse by more than the threshold.
+"""
+from typing import Dict, List, Optional
+import argparse
+import json
+import sys
+
+# Metrics where a bigger number is better. Everything else (timings, memory) is better when smaller.
+HIGHER_IS_BETTER: tuple = ("ops_per_second", "mb_per_second")
+# Bookkeeping values that aren't measurements
+IGNORED: tuple = ("samples", "words", "bytes")
+
+
+def flatten(results: dict, prefix: str = "") -> Dict[str, float]:
+    """
+    Flattens nested benchmark results into {"path/to/metric": value}, keeping only numbers.
+    """
+    flat: Dict[str, float] = {}
+    for key, value in results.items():
+        path: str = f"{prefix}/{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and key not in IGNORED:
+            flat[path] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Returns a report line for every metric present in both runs, marking the ones that regressed by more than the threshold.
+    """
+    old: Dict[str, float] = flatten({k: v for k, v in baseline.items() if k != "meta"})
+    new: Dict[str, float] = flatten({k: v for k, v in current.items() if k != "meta"})
+    lines: List[str] = []
+    for path in sorted(set(old) & set(new)):
+        if not old[path]:
+            continue
+        change: float = (new[path] - old[path]) / old[path]
+        worse: float = -change if path.endswith(HIGHER_IS_BETTER) else change
+        marker: str = "REGRESSION" if worse > threshold else "ok"
+        lines.append(f"{marker:<10} {path}: {old[path]:.4g} -> {new[path]:.4g} ({change:+.1%})")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two LESP benchmark runs.")
+    parser.add_argument("baseline", help="Results of the reference run.")
+    parser.add_argument("current", help="Results of the run to check.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed relative slowdown before a metric counts as a regression. Defaults to 0.1 (10%%).")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, "r") as f:
+        baseline: dict = json.load(f)
+    with open(args.current, "r") as f:
+        current: dict = json.load(f)
+
+    lines: List[str] = compare(baseline, current, args.threshold)
+    print("\n".join(lines))
+    return 1 if any(line.startswith("REGRESSION") for line in lines) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Seeded synthetic misspelling generator for the LESP benchmarks. The same seed always gives the same misspellings, so benchmark runs are comparable.
+"""
+from typing import List, Sequence, Set
+import random
+import string
+
+EDITS: tuple = ("delete", "insert", "substitute", "transpose")
+
+
+def misspell(word: str, rng: random.Random, edits: int = 1) -> str:
+    """
+    Applies random single-character edits to a word.
+
+    Args:
+        word (str): Word to misspell.
+        rng (random.Random): Random number generator to use.
+        edits (int): Number of edits to apply. Defaults to 1.
+
+    Returns:
+        str: The misspelled word. Might still be a valid word, see generate_misspellings.
+
+    Raises:
+        None
+    """
+    for _ in range(edits):
+        edit: str = rng.choice(EDITS)
+        if edit == "delete" and len(word) > 1:
+            i: int = rng.randrange(len(word))
+            word = word[:i] + word[i + 1:]
+        elif edit == "transpose" and len(word) > 1:
+            i = rng.randrange(len(word) - 1)
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+        elif edit == "substitute":
+            i = rng.randrange(len(word))
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+        else:
+            i = rng.randrange(len(word) + 1)
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    return word
+
+
+def generate_misspellings(words: Sequence[str], count: int, seed: int = 0, edits: int = 1, dictionary: Set[str] = None) -> List[str]:
+    """
+    Generates misspellings of randomly picked words. Results that happen to be valid words are skipped.
+
+    Args:
+        words (Sequence[str]): Words to misspell.
+        count (int): Number of misspellings to generate.
+        seed (int): Random seed. Defaults to 0.
+        edits (int): Number of edits per misspelling. Defaults to 1.
+        dictionary (Set[str]): Words that count as valid. Defaults to the words themselves.
+
+    Returns:
+        List[str]: List of misspellings.
+
+    Raises:
+        ValueError: If there are no words to misspell.
+    """
+    if not words:
+        raise ValueError("Can't generate misspellings without words.")
+    rng: random.Random = random.Random(seed)
+    valid: Set[str] = dictionary if dictionary is not None else set(words)
+    # Sort first, so the result doesn't depend on the order the wordlist was loaded in
+    pool: List[str] = sorted(words)
+    misspellings: List[str] = []
+    attempts: int = 0
+    while len(misspellings) < count and attempts < count * 100:
+        attempts += 1
+        typo: str = misspell(rng.choice(pool), rng, edits)
+        if typo and typo not in valid:
+            misspellings.append(typo)
+    return misspellings
@@ -0,0 +1,258 @@
+"""
+Reproducible benchmarks for the LESP hot paths. Runs offline against the bundled wordlists and prints the results as JSON, so runs can be compared with compare.py.
+
+Usage (from the root of the repository):
+    python benchmarks/run.py --output results.json
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lesp.autocorrect import Proofreader  # noqa: E402
+from lesp.tokenizer import Tokenizer  # noqa: E402
+from misspell import generate_misspellings  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_kb() -> Optional[int]:
+    """
+    Returns the peak resident set size of the current process in kilobytes, or None if the platform can't tell.
+    """
+    if resource is None:
+        return None
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarizes timings (in seconds) as milliseconds: mean and nearest-rank p50/p95/p99.
+    """
+    ordered: List[float] = sorted(samples)
+
+    def percentile(p: float) -> float:
+        index: int = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+        return ordered[index] * 1000
+
+    return {
+        "samples": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+    }
+
+
+def _load_in_child(path: str, queue: multiprocessing.Queue) -> None:
+    start: float = time.perf_counter()
+    Proofreader(wordlist_path=path, cache_file=None)
+    queue.put((time.perf_counter() - start, peak_rss_kb()))
+
+
+def bench_load(path: str, repeat: int) -> dict:
+    """
+    Measures Proofreader startup (load_wordlist) in fresh processes, so every run starts cold and the peak RSS belongs to the load alone.
+    """
+    context = multiprocessing.get_context("spawn")
+    timings: List[float] = []
+    peaks: List[int] = []
+    for _ in range(repeat):
+        queue = context.Queue()
+        process = context.Process(target=_load_in_child, args=(path, queue))
+        process.start()
+        seconds, peak = queue.get()
+        process.join()
+        timings.append(seconds)
+        if peak is not None:
+            peaks.append(peak)
+    result: dict = summarize(timings)
+    result["peak_rss_kb"] = max(peaks) if peaks else None
+    return result
+
+
+def bench_is_correct(proofreader: Proofreader, words: List[str], repeat: int) -> dict:
+    """
+    Measures is_correct throughput over a mix of valid words and misspellings.
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for word in words:
+            proofreader.is_correct(word)
+        best = min(best, time.perf_counter() - start)
+    return {"words": len(words), "seconds": best, "ops_per_second": len(words) / best if best else None}
+
+
+def legacy_remove_special(word: str) -> str:
+    # remove_special as it was before the tokenizer, kept as a baseline
+    for char in "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~":
+        word = word.replace(char, "")
+    return word
+
+
+def generate_text(words: List[str], typos: List[str], size: int, seed: int) -> str:
+    """
+    Generates roughly size characters of text from words and typos, with punctuation, digits and mixed case.
+    """
+    rng: random.Random = random.Random(seed)
+    pool: List[str] = sorted(words) + typos
+    pieces: List[str] = []
+    length: int = 0
+    while length < size:
+        word: str = rng.choice(pool)
+        roll: float = rng.random()
+        if roll < 0.1:
+            word = word.capitalize()
+        elif roll < 0.15:
+            word = f"\u201c{word}\u201d"
+        elif roll < 0.2:
+            word = f"{word}'s"
+        elif roll < 0.22:
+            word = str(rng.randrange(10000))
+        word += rng.choice((" ", " ", " ", " ", ", ", ". ", "! ", "? ", "; ", " \u2014 ", "\n"))
+        pieces.append(word)
+        length += len(word)
+    return "".join(pieces)
+
+
+def bench_tokenize(text: str, repeat: int) -> dict:
+    """
+    Measures splitting a text into words: the old split/lower/remove_special approach against Tokenizer.
+    """
+    tokenizer: Tokenizer = Tokenizer()
+    approaches: Dict[str, Callable] = {
+        "split_lower_replace": lambda: [legacy_remove_special(word.lower()) for word in text.split()],
+        "tokenize": lambda: tokenizer.tokenize(text),
+        "words": lambda: tokenizer.words(text),
+    }
+    megabytes: float = len(text.encode("utf-8")) / 1e6
+    results: dict = {"bytes": len(text.encode("utf-8"))}
+    for name, approach in approaches.items():
+        best: float = float("inf")
+        for _ in range(repeat):
+            start: float = time.perf_counter()
+            approach()
+            best = min(best, time.perf_counter() - start)
+        results[name] = {"seconds": best, "mb_per_second": megabytes / best}
+    return results
+
+
+# Every engine takes (proofreaders, word, similarity_rate, chunks, timeout) and returns the suggestions.
+# proofreaders holds a "plain" Proofreader and a "ranked" one with word frequencies loaded.
+ENGINES: Dict[str, Callable] = {
+    "scan": lambda proofreaders, word, rate, chunks, timeout: proofreaders["plain"].get_similar(word, rate, chunks=chunks),
+    "anytime": lambda proofreaders, word, rate, chunks, timeout: proofreaders["plain"].get_similar(word, rate, chunks=chunks, timeout=timeout),
+    "ranked": lambda proofreaders, word, rate, chunks, timeout: proofreaders["ranked"].get_similar(word, rate, chunks=chunks),
+}
+
+
+def bench_get_similar(proofreaders: Dict[str, Proofreader], typos: List[str], rates: List[float], chunks: List[int], engines: List[str], timeout: float) -> dict:
+    """
+    Measures get_similar latency for every combination of similarity rate, chunk count and engine.
+    """
+    results: dict = {}
+    for engine in engines:
+        for rate in rates:
+            for chunk_count in chunks:
+                timings: List[float] = []
+                for typo in typos:
+                    start: float = time.perf_counter()
+                    ENGINES[engine](proofreaders, typo, rate, chunk_count, timeout)
+                    timings.append(time.perf_counter() - start)
+                results[f"engine={engine},rate={rate},chunks={chunk_count}"] = summarize(timings)
+    return results
+
+
+def bench_cache(wordlist_path: str, typos: List[str], rate: float) -> dict:
+    """
+    Measures get_similar with the cache: a miss (full search plus writing the cache file) and a hit.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        proofreader: Proofreader = Proofreader(wordlist_path=wordlist_path, cache_file=os.path.join(directory, "lesp.cache"))
+        misses: List[float] = []
+        hits: List[float] = []
+        for typo in typos:
+            start: float = time.perf_counter()
+            proofreader.get_similar(typo, rate, use_cache=True, set_cache=True)
+            misses.append(time.perf_counter() - start)
+        for typo in typos:
+            start = time.perf_counter()
+            proofreader.get_similar(typo, rate, use_cache=True, set_cache=True)
+            hits.append(time.perf_counter() - start)
+    return {"miss": summarize(misses), "hit": summarize(hits)}
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmark the LESP hot paths.")
+    parser.add_argument("--wordlist", default=os.path.join(ROOT, "wordlist.txt"), help="Big wordlist, used for loading and is_correct.")
+    parser.add_argument("--small-wordlist", default=os.path.join(ROOT, "small_wordlist.txt"), help="Small wordlist, used for get_similar and the cache.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the misspelling generator.")
+    parser.add_argument("--samples", type=int, default=10, help="Misspellings per get_similar configuration.")
+    parser.add_argument("--lookups", type=int, default=2000, help="Words per is_correct run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions for load and is_correct.")
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.5, 0.7], help="Similarity rates to test.")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[1, 4], help="Chunk counts to test.")
+    parser.add_argument("--engines", nargs="+", default=sorted(ENGINES), choices=sorted(ENGINES), help="Search engines to test.")
+    parser.add_argument("--text-size", type=int, default=1000000, help="Characters of generated text for the tokenizer benchmark.")
+    parser.add_argument("--timeout", type=float, default=0.02, help="Time budget for the anytime engine, in seconds.")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    results: dict = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+    }
+
+    results["load_wordlist"] = {os.path.basename(path): bench_load(path, args.repeat) for path in (args.small_wordlist, args.wordlist)}
+
+    big: Proofreader = Proofreader(wordlist_path=args.wordlist, cache_file=None)
+    small: Proofreader = Proofreader(wordlist_path=args.small_wordlist, cache_file=None)
+
+    big_words: set = set(big.wordlist)
+    half: int = args.lookups // 2
+    lookups: List[str] = sorted(big_words)[::max(1, len(big_words) // half)][:half]
+    lookups += generate_misspellings(sorted(small.wordlist), args.lookups - len(lookups), args.seed, dictionary=big_words)
+    results["is_correct"] = bench_is_correct(big, lookups, args.repeat)
+
+    typos: List[str] = generate_misspellings(small.wordlist, args.samples, args.seed)
+    # small_wordlist.txt is sorted from most to least frequent, so it doubles as the frequency file
+    ranked: Proofreader = Proofreader(wordlist_path=args.small_wordlist, cache_file=None, frequency_path=args.small_wordlist)
+    results["get_similar"] = bench_get_similar({"plain": small, "ranked": ranked}, typos, args.rates, args.chunks, args.engines, args.timeout)
+    results["cache"] = bench_cache(args.small_wordlist, typos, args.rates[0])
+    text: str = generate_text(small.wordlist, generate_misspellings(small.wordlist, 1000, args.seed), args.text_size, args.seed)
+    results["tokenize"] = bench_tokenize(text, args.repeat)
+    results["peak_rss_kb"] = peak_rss_kb()
+
+    output: str = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
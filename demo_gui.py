@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import scrolledtext, messagebox, StringVar, OptionMenu
 
 from lesp.autocorrect import Proofreader
+from lesp.incremental import IncrementalChecker
 
 class CorrectionPopup:
     def __init__(self, master, word, options, replace_callback):
@@ -45,10 +46,19 @@ class SpellCheckerApp:
         self.check_button = tk.Button(self.root, text="Check Text", command=self.check_text)
         self.check_button.pack(pady=10)
 
-        self.proofreader = Proofreader(wordlist_path="small_wordlist.txt")
+        # Load in the background so the window shows up right away
+        self.proofreader = Proofreader(wordlist_path="small_wordlist.txt", lazy=True)
+        # Misspelled words waiting for their popup, one popup is shown at a time
+        self.pending = []
+        self.offered = set()
+        self.popup = None
+        # Remembers every word it has checked, and computes suggestions in the background
+        self.checker = IncrementalChecker(self.proofreader, similarity_rate=0.3, on_suggestions=self.suggestions_ready)
 
     def check_text(self):
         self.clear_highlight()
+        self.pending = []
+        self.offered = set()
         text_content = self.text_area.get("1.0", tk.END)
         incorrect_words = self.get_incorrect_words(text_content)
 
@@ -58,34 +68,42 @@ class SpellCheckerApp:
             self.highlight_incorrect_words(incorrect_words)
 
     def get_incorrect_words(self, text):
-        words = text.split()
-        incorrect_words = []
-
-        for word in words:
-            cleaned_word = self.proofreader.remove_special(word.lower())
-            if not self.proofreader.is_correct(cleaned_word):
-                incorrect_words.append(cleaned_word)
-
-        return set(incorrect_words)
+        # Returns (word, start, end) for every misspelled word
+        self.checker.set_text(text)
+        return self.checker.misspelled()
 
     def highlight_incorrect_words(self, incorrect_words):
-        for word in incorrect_words:
-            start_index = "1.0"
-            while True:
-                start_index = self.text_area.search(word, start_index, tk.END)
-                if not start_index:
-                    break
-                end_index = f"{start_index}+{len(word)}c"
-                self.text_area.tag_add("highlight", start_index, end_index)
-                start_index = end_index
-
-                similar_words = self.proofreader.get_similar(word, similarity_rate=0.3)
-                correction_options = CorrectionPopup(self.root, word, similar_words, self.replace_word)
-
-                # Make the popup bigger
-                correction_options.popup.geometry("300x150")
-                correction_options.popup.focus_force()
-                self.root.wait_window(correction_options.popup)
+        for word, start, end in incorrect_words:
+            self.text_area.tag_add("highlight", f"1.0+{start}c", f"1.0+{end}c")
+
+        # Suggestions found by an earlier check are ready now, the others arrive through suggestions_ready
+        for word in dict.fromkeys(word for word, start, end in incorrect_words):
+            similar_words = self.checker.suggestions(word)
+            if similar_words:
+                self.show_suggestions(word, similar_words)
+
+    def suggestions_ready(self, word, similar_words):
+        # Called on the checker's background thread, and Tk may only be used from the GUI thread
+        self.root.after(0, self.show_suggestions, word, similar_words)
+
+    def show_suggestions(self, word, similar_words):
+        if not similar_words or word in self.offered:
+            return
+        self.offered.add(word)
+        self.pending.append((word, similar_words))
+        self.show_next_popup()
+
+    def show_next_popup(self):
+        if (self.popup is not None and self.popup.popup.winfo_exists()) or not self.pending:
+            return
+        word, similar_words = self.pending.pop(0)
+        self.popup = CorrectionPopup(self.root, word, similar_words, self.replace_word)
+
+        # Make the popup bigger
+        self.popup.popup.geometry("300x150")
+        self.popup.popup.focus_force()
+        # Next one once this one is closed
+        self.popup.popup.bind("<Destroy>", lambda event: self.root.after(0, self.show_next_popup) if event.widget is self.popup.popup else None)
 
     def replace_word(self, old_word, new_word):
         start_index = "1.0"
@@ -7,13 +7,11 @@ proofreader = Proofreader()
 with open("text.txt", "r") as f:
     text = f.read()
 
-# Split the text into words
-words = text.split()
+# Split the text into lowercase words, without punctuation
+words = proofreader.tokenize(text)
 
 # Loop through the words and check if they are correct
-for word in words:
-    # Remove punctuation and make lowercase
-    word = word.strip(".,").lower()
+for word, start, end in words:
     # Check if the word is correct
     if not proofreader.is_correct(word):
         # Get a suggestion for the word
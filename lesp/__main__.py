@@ -0,0 +1,127 @@
+"""
+Command line tools for LESP. Run "python -m lesp --help" for the list of commands.
+"""
+from typing import List, Mapping, Optional, Set
+import argparse
+import heapq
+import os
+import sys
+import time
+
+from .autocorrect import Proofreader
+from .bloom import BloomFilter
+from .warm import EDIT_OPERATIONS, generate_edits, warm_cache
+
+
+def _read_misspellings(path: str) -> List[str]:
+    try:
+        with open(path, "r") as f:
+            # Only the first column, so lists like "teh the" work too
+            return [line.split()[0] for line in f if line.strip()]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{path} not found!")
+
+
+def _top_words(proofreader: Proofreader, dictionary: Set[str], count: int) -> List[str]:
+    frequencies: Mapping[str, int] = proofreader.frequencies
+    if frequencies:
+        return heapq.nlargest(count, (word for word in frequencies if word in dictionary), key=frequencies.__getitem__)
+    # Without frequencies, the wordlist is assumed to start with its most common words. The file is
+    # read again because the loaded wordlist may be sorted (shared index) rather than in file order.
+    words: List[str] = []
+    seen: Set[str] = set()
+    try:
+        with open(proofreader.wordlist_path, "r") as f:
+            for line in f:
+                parts: List[str] = line.split()
+                if parts and parts[0] not in seen:
+                    seen.add(parts[0])
+                    words.append(parts[0])
+                    if len(words) == count:
+                        break
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{proofreader.wordlist_path} not found!")
+    return words
+
+
+def _warm_cache_command(args: argparse.Namespace) -> int:
+    proofreader_options: dict = {"wordlist_path": args.wordlist, "frequency_path": args.frequency_path, "phonetic": args.phonetic}
+    if args.shared_index:
+        proofreader_options["shared_index"] = args.shared_index
+
+    misspellings: List[str] = []
+    if args.misspellings:
+        misspellings += _read_misspellings(args.misspellings)
+    if args.top:
+        proofreader: Proofreader = Proofreader(cache_file=None, **proofreader_options)
+        dictionary: Set[str] = set(proofreader.wordlist)
+        misspellings += generate_edits(_top_words(proofreader, dictionary, args.top), args.edits, dictionary=dictionary)
+    if not misspellings:
+        print("Nothing to warm: pass --misspellings and/or --top.", file=sys.stderr)
+        return 2
+
+    start: float = time.perf_counter()
+    count: int = warm_cache(misspellings, args.cache_file, proofreader_options, similarity_rate=args.similarity_rate, upto=args.upto, workers=args.workers, merge=not args.no_merge)
+    print(f"Wrote {count} entries to {args.cache_file} in {time.perf_counter() - start:.1f}s.")
+    return 0
+
+
+def _build_filter_command(args: argparse.Namespace) -> int:
+    start: float = time.perf_counter()
+    # Always rebuild, an up to date filter may have been built with a different false positive rate
+    filter_path: str = args.filter_path or f"{args.wordlist}.bloom"
+    if os.path.isfile(filter_path):
+        os.remove(filter_path)
+    proofreader: Proofreader = Proofreader(wordlist_path=args.wordlist, cache_file=None, shared_index=args.shared_index, low_memory=True, filter_path=filter_path, false_positive_rate=args.false_positive_rate)
+    bloom: BloomFilter = proofreader.membership_filter
+    print(f"Filter for {len(proofreader.wordlist)} words: {bloom.bit_count // 8} bytes, {bloom.hash_count} hashes, false positive rate {bloom.false_positive_rate():.4%}. Took {time.perf_counter() - start:.1f}s.")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs a command line tool.
+
+    Args:
+        argv (List[str]): Command line arguments, without the program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status.
+
+    Raises:
+        None
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog="python -m lesp", description="LESP command line tools.")
+    commands = parser.add_subparsers(dest="command")
+
+    warm: argparse.ArgumentParser = commands.add_parser("warm-cache", help="Pre-compute suggestions for common misspellings and write them to a cache file.")
+    warm.add_argument("--wordlist", default="lesp-wordlist.txt", help="Path to the wordlist. Defaults to lesp-wordlist.txt.")
+    warm.add_argument("--cache-file", default="lesp_cache/lesp.cache", help="Cache file to write. Defaults to lesp_cache/lesp.cache.")
+    warm.add_argument("--misspellings", help="File with one known misspelling per line.")
+    warm.add_argument("--top", type=int, default=0, help="Generate misspellings of the N most common words: the most frequent ones if there are word frequencies, otherwise the first N lines of the wordlist file.")
+    warm.add_argument("--edits", nargs="+", choices=EDIT_OPERATIONS, default=["delete", "transpose"], help="Edits used to generate misspellings. Defaults to delete and transpose.")
+    warm.add_argument("--frequency-path", help="Word frequency file, used to rank suggestions and to pick the top words.")
+    warm.add_argument("--phonetic", action="store_true", help="Include sound-alike suggestions.")
+    warm.add_argument("--shared-index", help="Shared index file, so the workers share one copy of the wordlist.")
+    warm.add_argument("--similarity-rate", type=float, default=0.5, help="Similarity rate between 0 and 1. Defaults to 0.5.")
+    warm.add_argument("--upto", type=int, default=3, help="Number of suggestions per misspelling. Defaults to 3.")
+    warm.add_argument("--workers", type=int, help="Number of worker processes. Defaults to the number of CPU cores.")
+    warm.add_argument("--no-merge", action="store_true", help="Overwrite the cache file instead of adding to it.")
+    warm.set_defaults(handler=_warm_cache_command)
+
+    bloom: argparse.ArgumentParser = commands.add_parser("build-filter", help="Build the shared index and membership filter used by low_memory mode.")
+    bloom.add_argument("--wordlist", default="lesp-wordlist.txt", help="Path to the wordlist. Defaults to lesp-wordlist.txt.")
+    bloom.add_argument("--shared-index", help="Shared index file to build. Defaults to the wordlist path with .idx appended.")
+    bloom.add_argument("--filter-path", help="Filter file to build. Defaults to the wordlist path with .bloom appended.")
+    bloom.add_argument("--false-positive-rate", type=float, default=0.001, help="Share of misspelled words the filter lets through. Defaults to 0.001.")
+    bloom.set_defaults(handler=_build_filter_command)
+
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
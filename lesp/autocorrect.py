@@ -1,11 +1,27 @@
 """
 LESP helps you to detect and correct spelling mistakes in your text. It is a Python library that uses the Levenshtein distance algorithm to find similar words in a wordlist. Overall it works quickly and does not require a lot of resources.
 """
-from typing import List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+import array
 import concurrent.futures
+import itertools
+import threading
+import time
 import os
+import warnings
+import re
 import json
 
+from .bloom import BloomFilter
+from .phonetic import PhoneticIndex, metaphone
+from .shared import SharedWordlist, WordlistView
+from .stats import Stats
+from .tokenizer import Tokenizer
+
+# Punctuation and symbols (ASCII and Unicode) plus the underscore, which \w would otherwise keep
+SPECIAL_CHARACTERS = re.compile(r"[^\w\s]|_")
+DEFAULT_TOKENIZER: Tokenizer = Tokenizer()
+
 class Proofreader:
     """
     Proofreader - The main component of LESP. Contains most of the functions and methods of the library.
@@ -13,12 +29,32 @@ class Proofreader:
     Args:
         wordlist_path (str): Path to the wordlist file. Defaults to "lesp-wordlist.txt".
         cache_file (str): Path to the cache file. Defaults to "lesp_cache/lesp.cache".
+        shared_index (str): Path to a shared index file to attach to instead of loading the wordlist into memory. If the file doesn't exist yet, or was built from a different version of the wordlist file, it is built from the wordlist first. Defaults to None.
+        lazy (bool): Whether to load the wordlist and cache on a background thread instead of blocking the constructor. Defaults to False.
+        hot_wordlist_path (str): Path to a small wordlist of common words, loaded right away so is_correct can answer for them while the full wordlist is still loading. Defaults to None.
+        instrument (bool): Whether to collect counters and timers for loading and get_similar. Defaults to False.
+        stats_hook (Callable[[str, dict], None]): Function called after every instrumented operation with the operation name ("load" or "get_similar") and that operation's stats. Only called when instrument is True. Errors raised by it are turned into warnings. Defaults to None.
+        frequency_path (str): Path to a word frequency file (see load_frequencies). When frequencies are known, get_similar ranks its results by frequency and stops early. Defaults to None.
+        phonetic (bool): Whether to load a phonetic index, so get_similar also suggests words that sound like the word. Defaults to False.
+        phonetic_index_path (str): Path to the phonetic index file. It's built and saved there if it doesn't exist or is out of date. Defaults to the shared index path (or, without a shared index, the wordlist path) with ".phonetic" appended.
+        low_memory (bool): Whether to keep the wordlist out of memory. The wordlist is attached as a shared index (shared_index, defaulting to the wordlist path with ".idx" appended) and is_correct is answered by a compact membership filter (see load_filter). Defaults to False.
+        filter_path (str): Path to the membership filter file. It's built and saved there if it doesn't exist or is out of date. Defaults to the wordlist path with ".bloom" appended.
+        false_positive_rate (float): Share of misspelled words the membership filter lets through as correct, used when the filter is built. Defaults to 0.001.
+        exact_check (bool): Whether to confirm words the membership filter accepts against the shared index on disk, so is_correct has no false positives. Defaults to False.
     
     Attributes:
         wordlist_path (str): Path to the wordlist file.
-        wordlist (List[str]): List of words in the wordlist.
+        wordlist (Union[List[str], SharedWordlist]): List of words in the wordlist.
+        shared_index (str): Path to the shared index file, or None.
         cache_file (str): Path to the cache file.
         cache (dict): Dictionary containing the cache data.
+        hot_words (set): Set of common words that are known to be correct before the wordlist is loaded.
+        ready (threading.Event): Set once the wordlist and cache are loaded.
+        stats_hook (Callable[[str, dict], None]): Function called with the stats of every instrumented operation, or None.
+        frequencies (Mapping[str, int]): Word frequencies, from the wordlist's frequency column (also stored in a shared index) or the frequency file. Empty if unknown.
+        phonetic_index (PhoneticIndex): Phonetic index of the wordlist, or None.
+        membership_filter (BloomFilter): Membership filter of the wordlist used by is_correct, or None.
+        exact_check (bool): Whether words accepted by the membership filter are confirmed against the wordlist.
     
     Raises:
         FileNotFoundError: If the wordlist file or cache file is not found.
@@ -28,10 +64,23 @@ class Proofreader:
     
     Methods:
         load_wordlist: Loads the wordlist file.
+        load_async: Loads the wordlist and cache on a background thread.
+        wait_until_ready: Waits until the wordlist and cache are loaded.
+        load_hot_words: Loads a small wordlist of common words.
+        load_frequencies: Loads a word frequency file.
+        load_phonetic_index: Loads (or builds) the phonetic index.
+        load_filter: Loads (or builds) the membership filter.
         load_cache: Loads the cache file.
+        validate_cache: Checks that cache data is in the correct format.
+        stats: Returns the collected counters and timers.
+        reset_stats: Clears the collected counters and timers.
+        build_shared_index: Writes the wordlist to a shared index file.
+        attach_shared_index: Attaches to a shared index file.
         save_cache: Saves the cache file.
         get_similarity_score: Calculates the similarity score between two words.
+        get_distance: Calculates the Levenshtein distance between two words.
         get_similar: Returns a list of similar words.
+        get_similar_anytime: Returns the best similar words found within a time budget.
         is_correct: Checks if a word is correct.
         backup: Backs up the wordlist file.
         restore: Restores the wordlist file from a backup.
@@ -40,15 +89,192 @@ class Proofreader:
         stack: Stacks two wordlist files.
         merge_delete: Merges two wordlist files and deletes the words in the first file from the second file.
         clear_cache: Clears the cache file.
+        remove_special: Removes special characters from a word.
+        tokenize: Splits a text into words with their offsets.
     """
-    def __init__(self, wordlist_path: str = "lesp-wordlist.txt", cache_file: str = "lesp_cache/lesp.cache") -> None:
+    def __init__(self, wordlist_path: str = "lesp-wordlist.txt", cache_file: str = "lesp_cache/lesp.cache", shared_index: Optional[str] = None, lazy: bool = False, hot_wordlist_path: Optional[str] = None, instrument: bool = False, stats_hook: Optional[Callable[[str, dict], None]] = None, frequency_path: Optional[str] = None, phonetic: bool = False, phonetic_index_path: Optional[str] = None, low_memory: bool = False, filter_path: Optional[str] = None, false_positive_rate: float = 0.001, exact_check: bool = False) -> None:
         self.wordlist_path: str = wordlist_path
-        self.wordlist: List[str] = []  # Initialize as an empty list
-        self.load_wordlist()
+        self.wordlist: Union[List[str], SharedWordlist] = []  # Initialize as an empty list
+        # Size and modification time of the wordlist file the wordlist came from, None once it's changed in memory
+        self._wordlist_source: Optional[dict] = None
+        # In low-memory mode the wordlist always lives in a shared index on disk
+        self.shared_index: Optional[str] = shared_index or (f"{wordlist_path}.idx" if low_memory else None)
         self.cache_file: str = cache_file
         self.cache: dict = {}
-        if cache_file:
-            self.load_cache(cache_file)
+        self.hot_words: set = set()
+        self.frequencies: Mapping[str, int] = {}
+        self.frequency_path: Optional[str] = frequency_path
+        self.phonetic_index: Optional[PhoneticIndex] = None
+        self._phonetic: bool = phonetic
+        self._phonetic_index_path: Optional[str] = phonetic_index_path
+        self.membership_filter: Optional[BloomFilter] = None
+        self.exact_check: bool = exact_check
+        self._low_memory: bool = low_memory
+        self._filter_path: Optional[str] = filter_path
+        self._false_positive_rate: float = false_positive_rate
+        self.ready: threading.Event = threading.Event()
+        self._load_future: Optional[concurrent.futures.Future] = None
+        # None when instrumentation is off, so the hot paths only pay for an "is not None" check
+        self._stats: Optional[Stats] = Stats() if instrument else None
+        self.stats_hook: Optional[Callable[[str, dict], None]] = stats_hook
+        # Positions of the words grouped by length and then by first letter, for get_similar_anytime. Built
+        # whenever the wordlist is loaded or changed, so the first time-bounded search doesn't pay for it.
+        # Not used with a shared wordlist, whose index file already stores the words by length.
+        self._length_index: Optional[Dict[int, Dict[str, array.array]]] = None
+        # Words sorted by frequency, most frequent first, built on first use by get_similar
+        self._frequency_order: Optional[Sequence[str]] = None
+        if hot_wordlist_path:
+            self.load_hot_words(hot_wordlist_path)
+        if lazy:
+            self.load_async()
+        else:
+            self._load()
+
+    def _load(self) -> None:
+        started: float = time.perf_counter()
+        if self.shared_index:
+            source: Optional[dict] = Proofreader._file_source(self.wordlist_path)
+            try:
+                self.attach_shared_index(self.shared_index)
+                # Without the wordlist file there's nothing to compare against, so the index is trusted
+                stale: bool = source is not None and self.wordlist.source != source
+            except (FileNotFoundError, ValueError):
+                stale = True
+            if stale:
+                if isinstance(self.wordlist, SharedWordlist):
+                    self.wordlist.close()
+                # Only read to build the shared index from, so there's no point in indexing it
+                self._load_wordlist(build_indexes=False)
+                self.build_shared_index(self.shared_index)
+                self.attach_shared_index(self.shared_index)
+        else:
+            self.load_wordlist()
+        if self.frequency_path:
+            self.load_frequencies(self.frequency_path)
+        if self._phonetic:
+            self.load_phonetic_index(self._phonetic_index_path)
+        if self._low_memory:
+            self.load_filter(self._filter_path, self._false_positive_rate)
+        if self.cache_file:
+            self.load_cache(self.cache_file)
+        # Ready before reporting, the load is done whatever the stats hook does
+        self.ready.set()
+        if self._stats is not None:
+            call_stats: Stats = Stats()
+            call_stats.record("load", time.perf_counter() - started)
+            self._report_stats("load", call_stats)
+
+    def _report_stats(self, operation: str, call_stats: Stats) -> None:
+        self._stats.merge(call_stats)
+        if self.stats_hook is not None:
+            # A broken metrics exporter shouldn't fail a load or a search that already succeeded
+            try:
+                self.stats_hook(operation, call_stats.snapshot())
+            except Exception as e:
+                warnings.warn(f"stats_hook failed for {operation}: {e!r}", RuntimeWarning)
+
+    def stats(self) -> dict:
+        """
+        Returns the counters and timers collected so far. Instrumentation must be turned on with the instrument argument.
+
+        Counters: get_similar_calls, candidates_considered, candidates_pruned, dp_cells, phonetic_candidates, cache_hits, cache_misses, cache_evictions.
+        Timers: load, partition, score, merge, executor_queue, get_similar.
+
+        Args:
+            None
+        
+        Returns:
+            dict: {"counters": {name: value}, "timers": {name: {"count", "total_seconds", "max_seconds"}}}, or an empty dict if instrumentation is off.
+        
+        Raises:
+            None
+        """
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """
+        Clears the counters and timers collected so far.
+
+        Args:
+            None
+        
+        Returns:
+            None
+        
+        Raises:
+            None
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def load_async(self) -> concurrent.futures.Future:
+        """
+        Loads (or reloads) the wordlist and cache on a background thread. Until loading finishes, is_correct answers from the hot words where it can, and everything else waits for the load to complete.
+
+        Args:
+            None
+        
+        Returns:
+            concurrent.futures.Future: Future that completes when loading is done. Its result() re-raises any loading error.
+        
+        Raises:
+            None
+        """
+        self.ready.clear()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._load_future = executor.submit(self._load)
+        executor.shutdown(wait=False)
+        return self._load_future
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the wordlist and cache are loaded. Returns immediately if the Proofreader wasn't loaded lazily.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait. Defaults to None (wait forever).
+        
+        Returns:
+            bool: True if loading is done, False if the timeout ran out first.
+        
+        Raises:
+            FileNotFoundError: If the background load failed because a file was not found.
+            ValueError: If the background load failed because a file was not in the correct format.
+        """
+        if self._load_future is None:
+            return True
+        try:
+            self._load_future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            return False
+        return True
+
+    def load_hot_words(self, path: str) -> None:
+        """
+        Loads a small wordlist of common words (for example "small_wordlist.txt"). Words in it are reported as correct by is_correct even before the full wordlist is loaded.
+
+        Args:
+            path (str): Path to the hot wordlist file.
+        
+        Returns:
+            None
+        
+        Raises:
+            FileNotFoundError: If the hot wordlist file is not found.
+            ValueError: If the hot wordlist file is not in the correct format.
+        
+        Requires:
+            The hot wordlist file must be in the same format as the wordlist file.
+        """
+        try:
+            with open(path, "r") as f:
+                hot_words: set = set(word.strip().lower() for word in f.read().strip().split("\n"))
+            if not all(word.isalpha() for word in hot_words):
+                raise ValueError("Invalid hot wordlist format. Words must contain only alphabetic characters.")
+            self.hot_words = hot_words
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{path} not found!")
 
 
     def load_wordlist(self) -> None:
@@ -66,20 +292,241 @@ class Proofreader:
             ValueError: If the wordlist file is not in the correct format.
         
         Requires:
-            The wordlist file must be in the correct format. Each word must be on a separate line. Words must contain only alphabetic characters.
+            The wordlist file must be in the correct format. Each word must be on a separate line. Words must contain only alphabetic characters. A word can optionally be followed by whitespace and its frequency (a whole number), which is loaded into the frequencies attribute.
         """
+        self._load_wordlist()
+
+    def _load_wordlist(self, build_indexes: bool = True) -> None:
         try:
+            # Before reading, so a change while reading makes the source look out of date rather than current
+            source: Optional[dict] = Proofreader._file_source(self.wordlist_path)
             with open(self.wordlist_path, "r") as f:
-                self.wordlist: List[str] = f.read().strip().split("\n")
-                # Remove duplicate words in the wordlist
-                self.wordlist = list(set(self.wordlist))
-                # Remove leading and trailing whitespaces from each word
-                self.wordlist = [word.strip() for word in self.wordlist]
-            if not all(word.isalpha() for word in self.wordlist):
+                content: str = f.read().strip()
+            frequencies: Dict[str, int] = {}
+            if " " in content or "\t" in content:
+                # Only pay for parsing columns when there might be any
+                content, frequencies = Proofreader._parse_frequencies(content, "wordlist")
+            # Remove leading and trailing whitespaces from each word, and duplicate words in the wordlist.
+            # dict keeps the order of the file, so every process ends up with the same list, which
+            # indexes that refer to words by position (like the phonetic index) rely on.
+            wordlist: List[str] = list(dict.fromkeys(word.strip() for word in content.split("\n")))
+            if not all(word.isalpha() for word in wordlist):
                 raise ValueError("Invalid wordlist format. Words must contain only alphabetic characters.")
+            # Assign once, so a background load never exposes a half-built wordlist
+            self.wordlist = wordlist
+            if frequencies:
+                self.frequencies = frequencies
+            self._invalidate_indexes()
+            self._wordlist_source = source
+            if build_indexes:
+                self._build_indexes()
         except FileNotFoundError:
             raise FileNotFoundError(f"{self.wordlist_path} not found!")
     
+    @staticmethod
+    def _file_source(path: str) -> Optional[dict]:
+        # Size and modification time of a file, used to tell whether files built from it are out of date
+        if not os.path.isfile(path):
+            return None
+        stat: os.stat_result = os.stat(path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    @staticmethod
+    def _parse_frequencies(content: str, kind: str) -> Tuple[str, Dict[str, int]]:
+        # Splits "word count" lines into the words (one per line, like a plain wordlist) and their counts
+        words: List[str] = []
+        frequencies: Dict[str, int] = {}
+        for line in content.split("\n"):
+            parts: List[str] = line.split()
+            if len(parts) > 2 or (len(parts) == 2 and not parts[1].isdigit()):
+                raise ValueError(f"Invalid {kind} format. Each line must contain a word, optionally followed by its frequency as a whole number.")
+            if not parts:
+                words.append("")
+                continue
+            words.append(parts[0])
+            if len(parts) == 2:
+                frequencies[parts[0].lower()] = frequencies.get(parts[0].lower(), 0) + int(parts[1])
+        return "\n".join(words), frequencies
+
+    def load_frequencies(self, path: str) -> None:
+        """
+        Loads a word frequency file. Each line holds a word, optionally followed by whitespace and its frequency (a whole number). If no line has a frequency, the words are assumed to be sorted from most to least frequent (like "small_wordlist.txt"), and ranked by their position.
+
+        Args:
+            path (str): Path to the frequency file.
+        
+        Returns:
+            None
+        
+        Raises:
+            FileNotFoundError: If the frequency file is not found.
+            ValueError: If the frequency file is not in the correct format.
+        """
+        try:
+            with open(path, "r") as f:
+                content: str = f.read().strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{path} not found!")
+        content, frequencies = Proofreader._parse_frequencies(content, "frequency file")
+        words: List[str] = [word.strip().lower() for word in content.split("\n") if word.strip()]
+        if not all(word.isalpha() for word in words):
+            raise ValueError("Invalid frequency file format. Words must contain only alphabetic characters.")
+        if not frequencies:
+            for rank, word in enumerate(words):
+                # Keep the first (most frequent) position of duplicates
+                frequencies.setdefault(word, len(words) - rank)
+        self.frequencies = frequencies
+        self.frequency_path = path
+        self._invalidate_indexes(wordlist_changed=False)
+
+    def load_phonetic_index(self, path: Optional[str] = None) -> None:
+        """
+        Loads the phonetic index of the wordlist. The index file stores positions of words in the wordlist and is memory-mapped, so loading it is instant and adds almost nothing to the memory of each process. If the index file doesn't exist, or was built from a different version of the wordlist (or a shared index instead of a wordlist file, or the other way around), the index is built from the current wordlist and saved, so only the first start pays for it. Once loaded, get_similar uses it for every call, and rebuilds it if the wordlist is changed with extend_wordlist, remove_from_wordlist or restore.
+
+        Args:
+            path (str): Path to the phonetic index file. Defaults to the shared index path (or, without a shared index, the wordlist path) with ".phonetic" appended.
+        
+        Returns:
+            None
+        
+        Raises:
+            None
+        """
+        self._phonetic = True
+        # Positions differ between a shared index (sorted) and a wordlist file (file order), so each gets its own file
+        path = path or f"{self.shared_index or self.wordlist_path}.phonetic"
+        # Compared with the source of the loaded wordlist (or shared index), like the membership filter
+        source: Optional[dict] = self._wordlist_source
+        try:
+            if source is None:
+                # The wordlist was changed in memory, so no saved index can match it
+                raise FileNotFoundError(path)
+            self.phonetic_index = PhoneticIndex.load(path, self.wordlist, source)
+        except (FileNotFoundError, ValueError):
+            self.phonetic_index = PhoneticIndex.build(self.wordlist)
+            if source is not None:
+                try:
+                    self.phonetic_index.save(path, source)
+                except OSError:
+                    # Read-only location, keep the index in memory only
+                    pass
+
+    def load_filter(self, path: Optional[str] = None, false_positive_rate: float = 0.001) -> None:
+        """
+        Loads the membership filter of the wordlist, a Bloom filter that takes about 1.8 bytes per word at the default false positive rate. Once loaded, is_correct answers from the filter: a word the filter rejects is definitely misspelled, and a word it accepts is correct (or, with exact_check, confirmed against the wordlist). If the filter file doesn't exist, or was built from a different version of the wordlist than the one loaded (or attached as a shared index), the filter is built from the loaded wordlist and saved, so only the first start pays for it. If the wordlist was changed in memory, the filter is built but not saved.
+
+        Args:
+            path (str): Path to the filter file. Defaults to the wordlist path with ".bloom" appended.
+            false_positive_rate (float): False positive rate of a newly built filter, between 0 and 1 (exclusive). A filter loaded from the file keeps the rate it was built with. Defaults to 0.001.
+        
+        Returns:
+            None
+        
+        Raises:
+            ValueError: If false_positive_rate is not between 0 and 1 (exclusive).
+        """
+        path = path or f"{self.wordlist_path}.bloom"
+        # The filter must match the words it answers for, so it's compared with (and stamped with)
+        # the source of the loaded wordlist or shared index, not with the wordlist file on disk
+        source: Optional[dict] = self._wordlist_source
+        try:
+            if source is None:
+                # The wordlist was changed in memory, so no saved filter can match it
+                raise FileNotFoundError(path)
+            self.membership_filter = BloomFilter.load(path, source)
+        except (FileNotFoundError, ValueError):
+            self.membership_filter = BloomFilter.build(self.wordlist, false_positive_rate)
+            if source is not None:
+                try:
+                    self.membership_filter.save(path, source)
+                except OSError:
+                    # Read-only location, keep the filter in memory only
+                    pass
+
+    def _add_phonetic_candidates(self, word: str, similar_words: List[str], upto: int, call_stats: Optional[Stats]) -> List[str]:
+        # Edit-distance results and words that sound like the word are ranked together, by distance and
+        # then frequency. Sound-alikes skip the similarity rate, since phonetic misspellings ("fizzix" ->
+        # "physics") are usually far apart by edit distance, so they only get in when they're at least as
+        # close as the worst of the upto best results (or there are fewer results than that). If none of
+        # those sounds like the word, the most frequent sound-alike still gets the last place, and only
+        # that one (never the only place, so the best edit-distance result always stays).
+        # Keys of a single sound match far too many words to be useful, so those are left out.
+        key: str = metaphone(word)
+        if len(key) < 2:
+            return similar_words
+        frequencies: Mapping[str, int] = self.frequencies
+        if self.phonetic_index is None:
+            # Dropped when the wordlist changed, so rebuild it for the current words
+            self.phonetic_index = PhoneticIndex.build(self.wordlist)
+        sounds_like: List[str] = [w for w in self.phonetic_index.lookup(word) if w != word]
+        if call_stats is not None:
+            call_stats.increment("phonetic_candidates", len(sounds_like))
+        if not sounds_like:
+            return similar_words
+
+        found: set = set(similar_words)
+        ranked: List[Tuple[int, int, str]] = sorted((Proofreader.get_distance(word, w), -frequencies.get(w, 0), w) for w in similar_words)
+        worst: Optional[int] = ranked[upto - 1][0] if len(ranked) >= upto else None
+        alikes: List[Tuple[int, int, str]] = sorted((Proofreader.get_distance(word, w), -frequencies.get(w, 0), w) for w in sounds_like)
+        merged: List[Tuple[int, int, str]] = sorted(ranked + [alike for alike in alikes if alike[2] not in found and (worst is None or alike[0] <= worst)])
+        # Sound-alikes without a known frequency (when frequencies are loaded) are usually obscure words
+        # that only happen to be close, so they don't count as the word's sound-alike being found
+        known: Callable[[str], bool] = (lambda w: frequencies.get(w, 0) > 0) if frequencies else (lambda w: True)
+        if upto > 1 and not any(metaphone(w) == key and known(w) for _, _, w in merged[:upto]):
+            # Most frequent first for this one, then nearest
+            best: Tuple[int, int, str] = min(alikes, key=lambda alike: (alike[1], alike[0], alike[2]))
+            merged = merged[:upto - 1] + [best] + [entry for entry in merged[upto - 1:] if entry[2] != best[2]]
+        return [w for _, _, w in merged]
+
+    def _invalidate_indexes(self, wordlist_changed: bool = True) -> None:
+        # Called whenever the wordlist or the frequencies change
+        self._frequency_order = None
+        if wordlist_changed:
+            self._length_index = None
+            self._wordlist_source = None
+            self.phonetic_index = None
+            # Words can't be taken out of a Bloom filter, so it's dropped rather than left
+            # answering for the old wordlist. is_correct falls back to the wordlist itself.
+            self.membership_filter = None
+
+    def build_shared_index(self, path: str) -> None:
+        """
+        Writes the current wordlist to a shared index file. Build it once before forking workers, then let every worker attach to it with attach_shared_index (or the shared_index argument), so they all share one copy of the dictionary. The index records which version of the wordlist file it was built from, so a Proofreader created with the shared_index argument rebuilds it when the wordlist file changes. Word frequencies (for example from the wordlist's frequency column) are stored too, along with the frequency order, so attached processes rank by frequency without keeping either in memory.
+
+        Args:
+            path (str): Path to the shared index file.
+        
+        Returns:
+            None
+        
+        Raises:
+            None
+        """
+        SharedWordlist.build(self.wordlist, path, self._wordlist_source, self.frequencies)
+
+    def attach_shared_index(self, path: str) -> None:
+        """
+        Attaches to a shared index file. The file is memory-mapped read-only and replaces the in-memory wordlist, so extend_wordlist and remove_from_wordlist will raise a TypeError afterwards. If the index has word frequencies, they replace the frequencies attribute.
+
+        Args:
+            path (str): Path to the shared index file.
+        
+        Returns:
+            None
+        
+        Raises:
+            FileNotFoundError: If the shared index file is not found.
+            ValueError: If the file is not a valid shared index.
+        """
+        wordlist: SharedWordlist = SharedWordlist(path)
+        self.wordlist = wordlist
+        if wordlist.frequencies is not None:
+            self.frequencies = wordlist.frequencies
+        self._invalidate_indexes()
+        self._wordlist_source = wordlist.source
+        self._build_indexes()
+        self.shared_index = path
+
     def load_cache(self, cache_file: str = "lesp.cache") -> None:
         """
         Loads the cache file. The cache file path is provided to the method as an argument.
@@ -99,14 +546,7 @@ class Proofreader:
             with open(cache_file, "r") as f:
                 # Validate cache file format and how words are stored
                 temp_cache: dict = json.load(f)
-                # Must follow the format {"word": ["similar", "words"]}
-                for word in temp_cache.keys():
-                    if not isinstance(word, str) or not word.islower() or not word.isalpha():
-                        raise ValueError("Invalid cache file format. Keys must be strings. Also, the strings must be all-lowercase and contain only alphabetic characters.")
-                    if not isinstance(temp_cache[word], list):
-                        raise ValueError("Invalid cache file format. Values must be lists.")
-                    if not all(isinstance(w, str) and w.islower() and w.isalpha() for w in temp_cache[word]):
-                        raise ValueError("Invalid cache file format. Values must be lists of strings. Also, the strings must be all-lowercase and contain only alphabetic characters.")
+                Proofreader.validate_cache(temp_cache)
                 self.cache: dict = temp_cache  # Use the loaded data
 
         except FileNotFoundError:
@@ -122,6 +562,30 @@ class Proofreader:
             raise ValueError("Invalid cache file format. Must be a valid JSON file.")
 
         
+    @staticmethod
+    def validate_cache(cache: dict) -> None:
+        """
+        Checks that loaded cache data follows the cache file format: {"word": ["similar", "words"]}.
+
+        Args:
+            cache (dict): Cache data to check.
+        
+        Returns:
+            None
+        
+        Raises:
+            ValueError: If the cache data is not in the correct format.
+        """
+        if not isinstance(cache, dict):
+            raise ValueError("Invalid cache file format. Must be a JSON object.")
+        for word in cache.keys():
+            if not isinstance(word, str) or not word.islower() or not word.isalpha():
+                raise ValueError("Invalid cache file format. Keys must be strings. Also, the strings must be all-lowercase and contain only alphabetic characters.")
+            if not isinstance(cache[word], list):
+                raise ValueError("Invalid cache file format. Values must be lists.")
+            if not all(isinstance(w, str) and w.islower() and w.isalpha() for w in cache[word]):
+                raise ValueError("Invalid cache file format. Values must be lists of strings. Also, the strings must be all-lowercase and contain only alphabetic characters.")
+
     def save_cache(self) -> None:
         """
         Saves the cache file. The cache file path is specified in the Proofreader object.
@@ -156,6 +620,27 @@ class Proofreader:
         Raises:
             None
         
+        Requires:
+            The two words must be strings.
+        """
+        score: float = 1 - Proofreader.get_distance(word1, word2) / max(len(word1), len(word2))
+        return score
+
+    @staticmethod
+    def get_distance(word1: str, word2: str) -> int:
+        """
+        Calculates the Levenshtein distance (the number of single-character insertions, deletions and substitutions needed to turn one word into the other) between two words.
+
+        Args:
+            word1 (str): First word.
+            word2 (str): Second word.
+        
+        Returns:
+            int: Levenshtein distance between the two words.
+        
+        Raises:
+            None
+        
         Requires:
             The two words must be strings.
         """
@@ -173,8 +658,7 @@ class Proofreader:
                 cost: int = 0 if word1[i - 1] == word2[j - 1] else 1
                 matrix[i][j] = min(matrix[i - 1][j] + 1, matrix[i][j - 1] + 1, matrix[i - 1][j - 1] + cost)
 
-        score: float = 1 - matrix[len1][len2] / max(len1, len2)
-        return score
+        return matrix[len1][len2]
 
     @staticmethod
     def get_similar_worker(args: tuple) -> List[str]:
@@ -182,7 +666,7 @@ class Proofreader:
         WARNING: DO NOT USE THIS METHOD DIRECTLY. USE THE get_similar METHOD INSTEAD.
 
         Args:
-            args (tuple): Tuple containing the word, similarity rate, and the wordlist chunk.
+            args (tuple): Tuple containing the word, similarity rate, and the wordlist chunk. Optionally followed by a Stats object (or None) and the time.perf_counter() time the chunk was submitted.
         
         Returns:
             List[str]: List of similar words.
@@ -198,17 +682,238 @@ class Proofreader:
         word: str
         similarity_rate: float
         wordlist_chunk: List[str]
-        word, similarity_rate, wordlist_chunk = args
+        word, similarity_rate, wordlist_chunk = args[:3]
+        stats: Optional[Stats] = args[3] if len(args) > 3 else None
+        if stats is not None:
+            stats.record("executor_queue", time.perf_counter() - args[4])
         similar_words: List[str] = []
         for w in wordlist_chunk:
             score: float = Proofreader.get_similarity_score(word, w)
             if score >= similarity_rate:
                 similar_words.append(w)
+        if stats is not None:
+            stats.increment("candidates_considered", len(wordlist_chunk))
+            stats.increment("dp_cells", len(word) * sum(len(w) for w in wordlist_chunk))
         return similar_words
 
+    @staticmethod
+    def get_similar_deadline_worker(args: tuple) -> Tuple[List[Tuple[float, str]], bool]:
+        """
+        WARNING: DO NOT USE THIS METHOD DIRECTLY. USE THE get_similar_anytime METHOD INSTEAD.
+
+        Args:
+            args (tuple): Tuple containing the word, similarity rate, the candidate list, a shared itertools.count handing out chunk numbers, the chunk size, the deadline (in time.monotonic() seconds), a Stats object (or None), and the time.perf_counter() time the worker was submitted.
+        
+        Returns:
+            Tuple[List[Tuple[float, str]], bool]: List of (score, similar word) pairs, and whether the worker ran out of chunks before the deadline.
+        
+        Raises:
+            None
+        
+        Requires:
+            The word must be a string.
+            The similarity rate must be a float between 0 and 1.
+            The candidate list must be a list of strings.
+        """
+        word: str
+        similarity_rate: float
+        candidates: Sequence[str]
+        next_chunk: Iterator[int]
+        chunk_size: int
+        deadline: float
+        stats: Optional[Stats]
+        submitted: float
+        word, similarity_rate, candidates, next_chunk, chunk_size, deadline, stats, submitted = args
+        if stats is not None:
+            stats.record("executor_queue", time.perf_counter() - submitted)
+        similar_words: List[Tuple[float, str]] = []
+        completed: bool = True
+        while completed:
+            # Chunks are handed out in order, so the most promising ones are scanned first
+            start: int = next(next_chunk) * chunk_size
+            if start >= len(candidates):
+                break
+            end: int = min(start + chunk_size, len(candidates))
+            for i in range(start, end):
+                # Checking the clock on every word would cost more than the words themselves
+                if i % 16 == 0 and time.monotonic() >= deadline:
+                    completed = False
+                    end = i
+                    break
+                score: float = Proofreader.get_similarity_score(word, candidates[i])
+                if score >= similarity_rate:
+                    similar_words.append((score, candidates[i]))
+            if stats is not None:
+                stats.increment("candidates_considered", end - start)
+                stats.increment("dp_cells", len(word) * sum(len(candidates[i]) for i in range(start, end)))
+        return similar_words, completed
+
+    def _get_length_index(self) -> Dict[int, Dict[str, array.array]]:
+        if self._length_index is None:
+            # Positions rather than words, so a shared wordlist isn't copied into memory
+            length_index: Dict[int, Dict[str, array.array]] = {}
+            for position, w in enumerate(self.wordlist):
+                by_letter: Dict[str, array.array] = length_index.setdefault(len(w), {})
+                positions: Optional[array.array] = by_letter.get(w[:1])
+                if positions is None:
+                    positions = by_letter[w[:1]] = array.array("I")
+                positions.append(position)
+            self._length_index = length_index
+        return self._length_index
+
+    def _build_indexes(self) -> None:
+        # Called once the wordlist is loaded or changed, so searches don't build indexes on the clock
+        if not isinstance(self.wordlist, SharedWordlist):
+            self._get_length_index()
+
+    @staticmethod
+    def _get_letter_range(wordlist: SharedWordlist, positions: array.array, letter: str) -> Tuple[int, int]:
+        # The shared wordlist is sorted, so within a length the words starting with letter are next to
+        # each other. Two binary searches find them, comparing only first letters.
+        bounds: List[int] = []
+        for inclusive in (False, True):
+            low: int = 0
+            high: int = len(positions)
+            while low < high:
+                middle: int = (low + high) // 2
+                first: str = wordlist[positions[middle]][:1]
+                if first < letter or (inclusive and first == letter):
+                    low = middle + 1
+                else:
+                    high = middle
+            bounds.append(low)
+        return bounds[0], bounds[1]
+
+    def _get_candidates_by_promise(self, word: str, similarity_rate: float) -> Sequence[str]:
+        # Nearest lengths first, and words sharing the first letter first within a length.
+        # Lengths that can't reach the similarity rate are skipped entirely, since the
+        # distance between two words is at least the difference of their lengths.
+        wordlist: Union[List[str], SharedWordlist] = self.wordlist
+        candidates: array.array = array.array("I")
+        if isinstance(wordlist, SharedWordlist):
+            max_length: int = wordlist.max_length
+        else:
+            length_index: Dict[int, Dict[str, array.array]] = self._get_length_index()
+            max_length = max(length_index, default=-1)
+        if max_length < 0:
+            return WordlistView(wordlist, candidates)
+        for difference in range(0, max(len(word), max_length) + 1):
+            for length in sorted(set((len(word) - difference, len(word) + difference))):
+                if length < 0 or length > max_length:
+                    continue
+                if difference > (1 - similarity_rate) * max(len(word), length):
+                    continue
+                if isinstance(wordlist, SharedWordlist):
+                    positions: array.array = wordlist.by_length(length)
+                    start, stop = Proofreader._get_letter_range(wordlist, positions, word[:1])
+                    candidates.extend(positions[start:stop])
+                    candidates.extend(positions[:start])
+                    candidates.extend(positions[stop:])
+                    continue
+                by_letter: Dict[str, array.array] = length_index.get(length, {})
+                if word[:1] in by_letter:
+                    candidates.extend(by_letter[word[:1]])
+                for letter, letter_positions in by_letter.items():
+                    if letter != word[:1]:
+                        candidates.extend(letter_positions)
+        return WordlistView(wordlist, candidates)
+
+    def _get_frequency_order(self) -> Sequence[str]:
+        if self._frequency_order is None:
+            frequencies: Mapping[str, int] = self.frequencies
+            wordlist: Union[List[str], SharedWordlist] = self.wordlist
+            if isinstance(wordlist, SharedWordlist):
+                if frequencies is wordlist.frequencies:
+                    # Stored in the index, so every process attached to it shares the same order
+                    self._frequency_order = wordlist.by_frequency()
+                else:
+                    # Only the positions are kept, so the words stay in the index instead of in memory
+                    keys: List[int] = [-frequencies.get(w, 0) for w in wordlist]
+                    self._frequency_order = WordlistView(wordlist, array.array("I", sorted(range(len(keys)), key=keys.__getitem__)))
+            else:
+                # sorted is stable, so words without a frequency keep their wordlist order at the end
+                self._frequency_order = sorted(wordlist, key=lambda w: -frequencies.get(w, 0))
+        return self._frequency_order
+
+    @staticmethod
+    def _get_bounded_distance(word1: str, word2: str, bound: int) -> Tuple[int, int]:
+        # Levenshtein distance, but only computing the cells within bound of the diagonal and giving
+        # up as soon as a whole row is over the bound. Returns bound + 1 if the distance is larger,
+        # along with the number of cells computed (for the dp_cells counter).
+        len1: int = len(word1)
+        len2: int = len(word2)
+        over: int = bound + 1
+        if abs(len1 - len2) > bound:
+            return over, 0
+        cells: int = 0
+        previous: List[int] = [min(j, over) for j in range(len2 + 1)]
+        for i in range(1, len1 + 1):
+            current: List[int] = [over] * (len2 + 1)
+            current[0] = min(i, over)
+            row_min: int = current[0]
+            char: str = word1[i - 1]
+            low: int = max(1, i - bound)
+            high: int = min(len2, i + bound)
+            cells += max(0, high - low + 1)
+            for j in range(low, high + 1):
+                cost: int = 0 if char == word2[j - 1] else 1
+                value: int = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost, over)
+                current[j] = value
+                if value < row_min:
+                    row_min = value
+            if row_min > bound:
+                return over, cells
+            previous = current
+        return previous[len2], cells
+
+    def _get_similar_ranked(self, word: str, similarity_rate: float, upto: int, call_stats: Optional[Stats]) -> List[str]:
+        # Visits words from most to least frequent and keeps the best upto words by (distance, frequency).
+        # A later word can only get in with a strictly smaller distance than the worst one kept, so the
+        # distance is computed with that bound, and the scan stops once all upto words are at the smallest
+        # possible distance (0 if the word itself is in the wordlist, 1 otherwise).
+        if call_stats is not None:
+            started: float = time.perf_counter()
+        order: Sequence[str] = self._get_frequency_order()
+        min_distance: int = 0 if word in self.wordlist else 1
+        if call_stats is not None:
+            partitioned: float = time.perf_counter()
+            call_stats.record("partition", partitioned - started)
+
+        best: List[Tuple[int, int, str]] = []
+        considered: int = 0
+        cells: int = 0
+        # Tiny epsilon so float rounding never makes the bound too tight, the exact check below decides
+        allowed: float = 1 - similarity_rate + 1e-9
+        for position, w in enumerate(order):
+            longest: int = max(len(w), len(word))
+            bound: int = int(allowed * longest)
+            if len(best) == upto:
+                bound = min(bound, best[-1][0] - 1)
+            # The distance is at least the difference in length
+            if abs(len(w) - len(word)) > bound:
+                continue
+            considered += 1
+            distance, computed = Proofreader._get_bounded_distance(word, w, bound)
+            cells += computed
+            if distance > bound or 1 - distance / longest < similarity_rate:
+                continue
+            best.append((distance, position, w))
+            best.sort()
+            del best[upto:]
+            if len(best) == upto and best[-1][0] <= min_distance:
+                break
+
+        if call_stats is not None:
+            call_stats.record("score", time.perf_counter() - partitioned)
+            call_stats.increment("candidates_considered", considered)
+            call_stats.increment("candidates_pruned", position + 1 - considered if order else 0)
+            call_stats.increment("dp_cells", cells)
+
+        return [w for _, _, w in best]
+
     def is_correct(self, word: str) -> bool:
         """
-        Checks if a word is correct.
+        Checks if a word is correct. If a membership filter is loaded (see load_filter), the filter answers instead of the wordlist.
 
         Args:
             word (str): Word to check.
@@ -222,12 +927,26 @@ class Proofreader:
         Requires:
             The word must be a string.
         """
-        return word.lower() in self.wordlist
-
-    def get_similar(self, word: str, similarity_rate: float, chunks: int = 4, upto: int = 3, use_cache: bool = False, set_cache: bool = False):
+        word = word.lower()
+        if not self.ready.is_set():
+            if word in self.hot_words:
+                return True
+            self.wait_until_ready()
+        if self.membership_filter is not None:
+            # No false negatives, so a rejected word is definitely misspelled
+            if word not in self.membership_filter:
+                return False
+            return not self.exact_check or word in self.wordlist
+        return word in self.wordlist
+
+    def get_similar(self, word: str, similarity_rate: float, chunks: int = 4, upto: int = 3, use_cache: bool = False, set_cache: bool = False, timeout: Optional[float] = None):
         """
         Returns a list of similar words, if any. If no similar words are found, returns None.
 
+        If a phonetic index is loaded, words that sound like the word are ranked together with the other results (by distance, then frequency), regardless of the similarity rate, but only when they're at least as close as the worst of the upto best results. If none of those sounds like the word and upto is more than 1, the most frequent sound-alike takes the last place.
+
+        If word frequencies are known (see load_frequencies), the words are scanned from most to least frequent on a single thread, and only the best upto words by distance (and then frequency) are kept, most similar first. The scan stops as soon as upto words at the smallest possible distance are found. The cache then stores only those upto words.
+
         Args:
             word (str): Word to check.
             similarity_rate (float): Similarity rate between 0 and 1.
@@ -235,6 +954,7 @@ class Proofreader:
             upto (int): Number of similar words to return. Defaults to 3.
             use_cache (bool): Whether to use the cache file. Defaults to False.
             set_cache (bool): Whether to set the cache file. Defaults to False.
+            timeout (float): Time budget in seconds. If given, the search is done by get_similar_anytime and returns the best words found when the budget runs out. Defaults to None (no limit).
         
         Returns:
             List[str]: List of similar words.
@@ -257,31 +977,78 @@ class Proofreader:
         if similarity_rate < 0 or similarity_rate > 1:
             raise ValueError("Similarity rate must be between 0 and 1.")
 
+        if timeout is not None:
+            return self.get_similar_anytime(word, similarity_rate, timeout, chunks, upto, use_cache, set_cache)[0]
+
+        self.wait_until_ready()
+
+        call_stats: Optional[Stats] = None
+        if self._stats is not None:
+            call_stats = Stats()
+            call_stats.increment("get_similar_calls")
+            started: float = time.perf_counter()
+
         word = word.lower()
         similar_words: List[str] = []
-        chunk_size = len(self.wordlist) // chunks
-
-        chunks = [(word, similarity_rate, self.wordlist[i:i + chunk_size]) for i in range(0, len(self.wordlist), chunk_size)]
 
         if use_cache and self.cache and self.cache_file and word in self.cache:
+            if call_stats is not None:
+                call_stats.increment("cache_hits")
+                call_stats.record("get_similar", time.perf_counter() - started)
+                self._report_stats("get_similar", call_stats)
             if self.cache[word] != []:
                 return self.cache[word][:upto]
             else:
                 return None
+        if call_stats is not None and use_cache:
+            call_stats.increment("cache_misses")
+
+        if self.frequencies:
+            similar_words = self._get_similar_ranked(word, similarity_rate, upto, call_stats)
+            if self._phonetic:
+                similar_words = self._add_phonetic_candidates(word, similar_words, upto, call_stats)
+
+            if set_cache and self.cache_file and word not in self.cache:
+                self.cache[word] = similar_words
+                self.save_cache()
+
+            if call_stats is not None:
+                call_stats.record("get_similar", time.perf_counter() - started)
+                self._report_stats("get_similar", call_stats)
+
+            return similar_words[:upto] if similar_words else None
+
+        chunk_size = len(self.wordlist) // chunks
+
+        chunks = [(word, similarity_rate, self.wordlist[i:i + chunk_size], call_stats, time.perf_counter()) for i in range(0, len(self.wordlist), chunk_size)]
+
+        if call_stats is not None:
+            partitioned: float = time.perf_counter()
+            call_stats.record("partition", partitioned - started)
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
            results: List[List[str]] = list(executor.map(Proofreader.get_similar_worker, chunks))
 
+        if call_stats is not None:
+            scored: float = time.perf_counter()
+            call_stats.record("score", scored - partitioned)
 
         for similar_word_list in results:
             similar_words.extend(similar_word_list)
 
         similar_words = list(set(similar_words))
+        if self._phonetic:
+            similar_words = self._add_phonetic_candidates(word, similar_words, upto, call_stats)
 
         if set_cache and self.cache_file and word not in self.cache:
             self.cache[word] = similar_words
             self.save_cache()
 
+        if call_stats is not None:
+            call_stats.record("merge", time.perf_counter() - scored)
+            call_stats.record("get_similar", time.perf_counter() - started)
+            self._report_stats("get_similar", call_stats)
+
 
         if len(similar_words) == 0:
             return None
@@ -289,6 +1056,118 @@ class Proofreader:
             # Return only upto similar words
             return similar_words[:upto]
 
+    def get_similar_anytime(self, word: str, similarity_rate: float, timeout: float, chunks: int = 4, upto: int = 3, use_cache: bool = False, set_cache: bool = False) -> Tuple[Optional[List[str]], bool]:
+        """
+        Returns the most similar words found within a time budget. Candidates are visited in order of promise (nearest lengths first, then words sharing the first letter), so the best matches are usually found early. When the budget runs out, pending chunks are cancelled and the best words found so far are returned.
+
+        Args:
+            word (str): Word to check.
+            similarity_rate (float): Similarity rate between 0 and 1.
+            timeout (float): Time budget in seconds.
+            chunks (int): Number of workers scanning at the same time. Workers take small chunks of candidates in order of promise. Defaults to 4.
+            upto (int): Number of similar words to return. Defaults to 3.
+            use_cache (bool): Whether to use the cache file. Defaults to False.
+            set_cache (bool): Whether to set the cache file. Only complete searches are cached. Defaults to False.
+        
+        Returns:
+            Tuple[Optional[List[str]], bool]: List of similar words, most similar first (by distance and then frequency if word frequencies are known), or None if no similar words were found, and whether the search completed within the budget.
+        
+        Raises:
+            ValueError: If upto is less than 1.
+            ValueError: If chunks is less than 1.
+            ValueError: If similarity_rate is not between 0 and 1.
+            ValueError: If timeout is negative.
+        
+        Requires:
+            The word must be a string.
+            The similarity rate must be a float between 0 and 1.
+        """
+        if upto < 1:
+            raise ValueError("Can only return 1 or more similar words.")
+        if chunks < 1:
+            raise ValueError("Can only split into 1 or more chunks.")
+        if similarity_rate < 0 or similarity_rate > 1:
+            raise ValueError("Similarity rate must be between 0 and 1.")
+        if timeout < 0:
+            raise ValueError("Timeout can't be negative.")
+
+        deadline: float = time.monotonic() + timeout
+        self.wait_until_ready()
+
+        call_stats: Optional[Stats] = None
+        if self._stats is not None:
+            call_stats = Stats()
+            call_stats.increment("get_similar_calls")
+            started: float = time.perf_counter()
+
+        word = word.lower()
+
+        if use_cache and self.cache and self.cache_file and word in self.cache:
+            if call_stats is not None:
+                call_stats.increment("cache_hits")
+                call_stats.record("get_similar", time.perf_counter() - started)
+                self._report_stats("get_similar", call_stats)
+            if self.cache[word] != []:
+                return self.cache[word][:upto], True
+            else:
+                return None, True
+        if call_stats is not None and use_cache:
+            call_stats.increment("cache_misses")
+
+        candidates: Sequence[str] = self._get_candidates_by_promise(word, similarity_rate)
+        next_chunk: Iterator[int] = itertools.count()
+        task: tuple = (word, similarity_rate, candidates, next_chunk, 256, deadline, call_stats, time.perf_counter())
+
+        if call_stats is not None:
+            call_stats.increment("candidates_pruned", len(self.wordlist) - len(candidates))
+            partitioned: float = time.perf_counter()
+            call_stats.record("partition", partitioned - started)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=chunks)
+        futures: List[concurrent.futures.Future] = [executor.submit(Proofreader.get_similar_deadline_worker, task) for _ in range(chunks)]
+        concurrent.futures.wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        for future in futures:
+            future.cancel()
+        # Workers that are already running stop on their own at the deadline
+        executor.shutdown(wait=True)
+
+        if call_stats is not None:
+            scored_at: float = time.perf_counter()
+            call_stats.record("score", scored_at - partitioned)
+
+        completed: bool = True
+        scored: List[Tuple[float, str]] = []
+        for future in futures:
+            if future.cancelled():
+                completed = False
+                continue
+            found, finished = future.result()
+            scored.extend(found)
+            completed = completed and finished
+
+        frequencies: Mapping[str, int] = self.frequencies
+        if frequencies:
+            # Same ranking as get_similar with frequencies: by distance, then most frequent first
+            scored.sort(key=lambda pair: (round((1 - pair[0]) * max(len(pair[1]), len(word))), -frequencies.get(pair[1], 0), pair[1]))
+        else:
+            scored.sort(key=lambda pair: (-pair[0], abs(len(pair[1]) - len(word)), pair[1]))
+        similar_words: List[str] = [w for _, w in scored]
+        if self._phonetic:
+            similar_words = self._add_phonetic_candidates(word, similar_words, upto, call_stats)
+
+        if completed and set_cache and self.cache_file and word not in self.cache:
+            self.cache[word] = similar_words
+            self.save_cache()
+
+        if call_stats is not None:
+            call_stats.record("merge", time.perf_counter() - scored_at)
+            call_stats.record("get_similar", time.perf_counter() - started)
+            self._report_stats("get_similar", call_stats)
+
+        if len(similar_words) == 0:
+            return None, completed
+        return similar_words[:upto], completed
+
     def backup(self, path: str = "wordlist_backup") -> None:
         """
         Backs up the wordlist file.
@@ -302,6 +1181,7 @@ class Proofreader:
         Raises:
             ValueError: If the path specified is a directory.
         """
+        self.wait_until_ready()
         if os.path.isdir(path):
             raise ValueError("Path specified is a directory!")
         with open(path, "w") as f:
@@ -325,6 +1205,7 @@ class Proofreader:
         Requires:
             The backup file must be in the correct format. Each word must be on a separate line. Words must contain only alphabetic characters.
         """
+        self.wait_until_ready()
         try:
             if not os.path.isfile(path):
                 raise FileNotFoundError("Backup file not found!")
@@ -345,6 +1226,8 @@ class Proofreader:
                 raise ValueError("Invalid backup file format. Words must be all-lowercase and contain only alphabetic characters.")
 
             self.wordlist = wordlist_
+            self._invalidate_indexes()
+            self._build_indexes()
 
             if overwrite_current:
                 with open(self.wordlist_path, "w") as f:
@@ -370,19 +1253,18 @@ class Proofreader:
             Each word must be a string.
             Each word must be alphabetic.
         """
-        if isinstance(word, str):
-            if word.isalpha():
-                self.wordlist.append(word.lower())
-            else:
-                raise ValueError(f"Invalid input: '{word}' is not a valid word.")
-        elif isinstance(word, (list, tuple)):
-            for w in word:
-                if isinstance(w, str) and w.isalpha():
-                    self.wordlist.append(w.lower())
-                else:
-                    raise ValueError(f"Invalid input: '{word}' is not a valid word.")
-        else:
-            raise TypeError("Invalid input type. Please provide a string, list, or tuple of alphabetic words.")
+        self.wait_until_ready()
+        words: List[str] = Proofreader._validate_words(word)
+        changed: bool = False
+        try:
+            for w in words:
+                self.wordlist.append(w.lower())
+                changed = True
+        finally:
+            # Only once the wordlist has changed, a rejected call keeps the indexes (and the filter)
+            if changed:
+                self._invalidate_indexes()
+                self._build_indexes()
 
     def remove_from_wordlist(self, word: Union[str, List[str], tuple]) -> None:
         """
@@ -402,25 +1284,34 @@ class Proofreader:
             Each word must be a string.
             Each word must be alphabetic.
         """
+        self.wait_until_ready()
+        words: List[str] = Proofreader._validate_words(word)
+        for w in words:
+            if w not in self.wordlist:
+                raise ValueError(f"\"{w}\" not in wordlist!")
+        changed: bool = False
+        try:
+            for w in words:
+                self.wordlist.remove(w)
+                changed = True
+        finally:
+            # Only once the wordlist has changed, a rejected call keeps the indexes (and the filter)
+            if changed:
+                self._invalidate_indexes()
+                self._build_indexes()
+
+    @staticmethod
+    def _validate_words(word: Union[str, List[str], tuple]) -> List[str]:
+        # Checks the input of extend_wordlist and remove_from_wordlist before anything is changed
         if isinstance(word, str):
-            if word.isalpha():
-                if word in self.wordlist:
-                    self.wordlist.remove(word)
-                else:
-                    raise ValueError(f"\"{word}\" not in wordlist!")
-            else:
+            if not word.isalpha():
                 raise ValueError(f"Invalid input: '{word}' is not a valid word.")
-        elif isinstance(word, (list, tuple)):
-            for w in word:
-                if isinstance(w, str) and w.isalpha():
-                    if w in self.wordlist:
-                        self.wordlist.remove(w)
-                    else:
-                        raise ValueError(f"\"{w}\" not in wordlist!")
-                else:
-                    raise ValueError(f"Invalid input: '{word}' is not a valid word.")
-        else:
-            raise TypeError("Invalid input type. Please provide a string, list, or tuple of alphabetic words.")
+            return [word]
+        if isinstance(word, (list, tuple)):
+            if not all(isinstance(w, str) and w.isalpha() for w in word):
+                raise ValueError(f"Invalid input: '{word}' is not a valid word.")
+            return list(word)
+        raise TypeError("Invalid input type. Please provide a string, list, or tuple of alphabetic words.")
 
     @staticmethod
     def stack(source: str, destination: str) -> None:
@@ -567,9 +1458,12 @@ class Proofreader:
         Requires:
             The cache file must be in the correct format. Each word must be on a separate line. Words must contain only alphabetic characters.
         """
+        self.wait_until_ready()
         if cache_file:
             try:
                 os.remove(cache_file)
+                if self._stats is not None:
+                    self._stats.increment("cache_evictions", len(self.cache))
                 self.cache = {}
                 # If there also was a directory, remove it
                 if os.path.isdir(os.path.dirname(cache_file)):
@@ -581,7 +1475,7 @@ class Proofreader:
     
     def remove_special(self, word: str) -> str:
         """
-        Removes special characters from a word.
+        Removes special characters (ASCII and Unicode punctuation and symbols) from a word in a single pass. To split a whole text into words, use tokenize instead.
 
         Args:
             word (str): Word to remove special characters from.
@@ -595,10 +1489,25 @@ class Proofreader:
         Requires:
             The word must be a string.
         """
-        special_chars: str = "!\"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"
-        for char in special_chars:
-            word = word.replace(char, "")
+        return SPECIAL_CHARACTERS.sub("", word)
+
+    def tokenize(self, text: str, tokenizer: Optional[Tokenizer] = None) -> List[Tuple[str, int, int]]:
+        """
+        Splits a text into lowercase words in a single pass, with the offsets of every word in the text. Punctuation (Unicode included), digits and whitespace separate words, and apostrophes are removed ("don't" -> "dont"). Use a Tokenizer for other rules.
+
+        Args:
+            text (str): Text to split.
+            tokenizer (Tokenizer): Tokenizer to use instead of the default one. Defaults to None.
+        
+        Returns:
+            List[Tuple[str, int, int]]: (word, start, end) for every word, where text[start:end] is the word as it appears in the text.
+        
+        Raises:
+            None
         
-        return word
+        Requires:
+            The text must be a string.
+        """
+        return (tokenizer or DEFAULT_TOKENIZER).tokenize(text)
     
 
@@ -0,0 +1,192 @@
+"""
+Compact membership filter for low-memory spell checking. A Bloom filter answers "definitely not in the wordlist" with no false negatives, using a few bits per word instead of a Python string per word.
+"""
+from typing import Iterable, Optional, Tuple
+import hashlib
+import math
+import os
+import struct
+
+# File layout:
+#   header - magic (8 bytes) + hash count (uint32) + bit count (uint64) + word count (uint64)
+#            + source size (uint64) + source modification time (double)
+#   bits   - the bit array, bit i is bit (i % 8) of byte i // 8
+MAGIC: bytes = b"LESPBLM1"
+HEADER: struct.Struct = struct.Struct("<8sIQQQd")
+
+
+def _hashes(word: str) -> Tuple[int, int]:
+    # Two independent 64-bit hashes from one digest, combined as h1 + i * h2 (Kirsch-Mitzenmacher).
+    # hashlib instead of hash(), since hash() of a str changes between processes.
+    digest: bytes = hashlib.blake2b(word.encode("utf-8"), digest_size=16).digest()
+    # h2 is odd so it never gets stuck on the same bit
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """
+    BloomFilter - A fixed-size set of words that can answer "maybe in the set" or "definitely not in the set". Words are never missed (no false negatives), and a word that was never added is reported as present with a configurable probability (the false positive rate).
+
+    Args:
+        bit_count (int): Size of the bit array in bits.
+        hash_count (int): Number of bits set per word.
+        bits (bytearray): The bit array. Defaults to an empty (all zero) array.
+        word_count (int): Number of words added. Defaults to 0.
+
+    Attributes:
+        bit_count (int): Size of the bit array in bits.
+        hash_count (int): Number of bits set per word.
+        word_count (int): Number of words added.
+
+    Raises:
+        ValueError: If bit_count or hash_count is less than 1, or bits has the wrong size.
+
+    Methods:
+        build: Builds a filter from a list of words.
+        load: Loads a filter from a file.
+        save: Saves the filter to a file.
+        add: Adds a word.
+        false_positive_rate: Returns the expected false positive rate.
+    """
+    def __init__(self, bit_count: int, hash_count: int, bits: Optional[bytearray] = None, word_count: int = 0) -> None:
+        if bit_count < 1 or hash_count < 1:
+            raise ValueError("A Bloom filter needs at least 1 bit and 1 hash.")
+        byte_count: int = (bit_count + 7) // 8
+        if bits is not None and len(bits) != byte_count:
+            raise ValueError(f"Expected {byte_count} bytes of bits, got {len(bits)}.")
+        self.bit_count: int = bit_count
+        self.hash_count: int = hash_count
+        self.word_count: int = word_count
+        self._bits: bytearray = bits if bits is not None else bytearray(byte_count)
+
+    @staticmethod
+    def build(words: Iterable[str], false_positive_rate: float = 0.001, word_count: Optional[int] = None) -> "BloomFilter":
+        """
+        Builds a filter sized for a list of words and a target false positive rate. A rate of 0.001 takes about 14.4 bits (1.8 bytes) per word, 0.01 about 9.6 bits.
+
+        Args:
+            words (Iterable[str]): Words to add.
+            false_positive_rate (float): Target false positive rate, between 0 and 1 (exclusive). Defaults to 0.001.
+            word_count (int): Number of words, if words is an iterator that can't be counted with len. Defaults to len(words).
+
+        Returns:
+            BloomFilter: The new filter.
+
+        Raises:
+            ValueError: If false_positive_rate is not between 0 and 1 (exclusive).
+        """
+        if false_positive_rate <= 0 or false_positive_rate >= 1:
+            raise ValueError("False positive rate must be between 0 and 1 (exclusive).")
+        if word_count is None:
+            word_count = len(words)
+        # Optimal sizes: m = -n ln(p) / ln(2)^2 bits and k = m / n ln(2) hashes
+        bit_count: int = max(8, math.ceil(-max(word_count, 1) * math.log(false_positive_rate) / math.log(2) ** 2))
+        hash_count: int = max(1, round(bit_count / max(word_count, 1) * math.log(2)))
+        bloom: BloomFilter = BloomFilter(bit_count, hash_count)
+        for word in words:
+            bloom.add(word)
+        return bloom
+
+    @staticmethod
+    def load(path: str, source: Optional[dict] = None) -> "BloomFilter":
+        """
+        Loads a filter from a file written by save.
+
+        Args:
+            path (str): Path to the filter file.
+            source (dict): If given, the filter must have been saved with the same source ({"size", "mtime"}), otherwise it's considered out of date. Defaults to None.
+
+        Returns:
+            BloomFilter: The loaded filter.
+
+        Raises:
+            FileNotFoundError: If the filter file is not found.
+            ValueError: If the filter file is not in the correct format, or is out of date.
+        """
+        try:
+            with open(path, "rb") as f:
+                header: bytes = f.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    raise ValueError("Invalid filter format. The file is too short.")
+                magic, hash_count, bit_count, word_count, source_size, source_mtime = HEADER.unpack(header)
+                if magic != MAGIC:
+                    raise ValueError("Invalid filter format. Wrong file signature.")
+                if source is not None and (source["size"], source["mtime"]) != (source_size, source_mtime):
+                    raise ValueError("Filter is out of date.")
+                bits: bytearray = bytearray(f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{path} not found!")
+        return BloomFilter(bit_count, hash_count, bits, word_count)
+
+    def save(self, path: str, source: Optional[dict] = None) -> None:
+        """
+        Saves the filter to a file.
+
+        Args:
+            path (str): Path to the filter file.
+            source (dict): Size and modification time ({"size", "mtime"}) of the wordlist file the filter was built from, checked by load. Defaults to None.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        source = source or {"size": 0, "mtime": 0.0}
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.hash_count, self.bit_count, self.word_count, source["size"], source["mtime"]))
+            f.write(self._bits)
+        os.replace(temp_path, path)
+
+    def add(self, word: str) -> None:
+        """
+        Adds a word.
+
+        Args:
+            word (str): Word to add.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        h1, h2 = _hashes(word)
+        bits: bytearray = self._bits
+        for i in range(self.hash_count):
+            bit: int = (h1 + i * h2) % self.bit_count
+            bits[bit >> 3] |= 1 << (bit & 7)
+        self.word_count += 1
+
+    def false_positive_rate(self) -> float:
+        """
+        Returns the expected false positive rate for the words added so far.
+
+        Args:
+            None
+
+        Returns:
+            float: Probability that a word that was never added is reported as present.
+
+        Raises:
+            None
+        """
+        return (1 - math.exp(-self.hash_count * self.word_count / self.bit_count)) ** self.hash_count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        h1, h2 = _hashes(word)
+        bits: bytearray = self._bits
+        for i in range(self.hash_count):
+            bit: int = (h1 + i * h2) % self.bit_count
+            if not bits[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.word_count
@@ -0,0 +1,364 @@
+"""
+Incremental spell checking for live editors. Instead of re-checking the whole text after every change, the checker takes edits (insert, delete, replace at an offset) and only re-checks the words the edit touched.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import bisect
+import concurrent.futures
+import threading
+
+from .autocorrect import Proofreader
+from .tokenizer import Tokenizer
+
+Token = Tuple[str, int, int]
+
+# Number of words per block when blocks are (re)built. A block is split once it grows past twice this size.
+BLOCK_SIZE: int = 256
+
+
+class IncrementalChecker:
+    """
+    IncrementalChecker - Keeps a text, its words and their spelling in sync as the text is edited. Results are memoised per word, so a word is only looked up once, and suggestions for misspelled words are computed in the background and delivered to a callback.
+
+    Args:
+        proofreader (Proofreader): Proofreader used to check words and get suggestions.
+        text (str): Initial text. Defaults to "".
+        on_suggestions (Callable[[str, Optional[List[str]]], None]): Called with a misspelled word and its suggestions (or None) once they're ready, if the word is still in the text. Runs on a background thread, so GUI code should hand it over to the GUI thread. Defaults to None.
+        tokenizer (Tokenizer): Tokenizer used to split the text into words. Defaults to the same rules as Proofreader.tokenize.
+        similarity_rate (float): Similarity rate passed to get_similar. Defaults to 0.5.
+        upto (int): Number of suggestions per word. Defaults to 3.
+        timeout (float): Time budget per suggestion search, passed to get_similar. Defaults to None (no limit).
+
+    Attributes:
+        proofreader (Proofreader): Proofreader used to check words and get suggestions.
+        text (str): Current text.
+        on_suggestions (Callable[[str, Optional[List[str]]], None]): Suggestion callback, or None.
+
+    Raises:
+        None
+
+    Methods:
+        set_text: Replaces the whole text and re-checks it.
+        insert: Inserts text at an offset.
+        delete: Deletes text at an offset.
+        replace: Replaces a range of the text.
+        tokens: Returns all words with their offsets.
+        misspelled: Returns the misspelled words with their offsets.
+        suggestions: Returns the suggestions for a misspelled word.
+        close: Stops computing suggestions in the background.
+    """
+    def __init__(self, proofreader: Proofreader, text: str = "", on_suggestions: Optional[Callable[[str, Optional[List[str]]], None]] = None, tokenizer: Optional[Tokenizer] = None, similarity_rate: float = 0.5, upto: int = 3, timeout: Optional[float] = None) -> None:
+        self.proofreader: Proofreader = proofreader
+        self.text: str = ""
+        self.on_suggestions: Optional[Callable[[str, Optional[List[str]]], None]] = on_suggestions
+        self._tokenizer: Tokenizer = tokenizer or Tokenizer()
+        self._similarity_rate: float = similarity_rate
+        self._upto: int = upto
+        self._timeout: Optional[float] = timeout
+        # Tokens sorted by offset, in blocks, with their starts and ends kept separately for bisect. Offsets
+        # in a block are relative to the block's shift (see _shift), so an edit moves all the words after it
+        # by changing the shifts of the blocks after it instead of rewriting every word.
+        self._blocks: List[List[Token]] = []
+        self._block_starts: List[List[int]] = []
+        self._block_ends: List[List[int]] = []
+        # Fenwick tree over the differences between the shifts of neighbouring blocks, so a shift is a
+        # prefix sum and moving every block from one on is a single update, both O(log n)
+        self._shift_tree: List[int] = [0]
+        self._correct: Dict[str, bool] = {}
+        # How many times every word appears in the text, so suggestions for words that are gone can be dropped
+        self._counts: Dict[str, int] = {}
+        self._suggestions: Dict[str, concurrent.futures.Future] = {}
+        self._lock: threading.Lock = threading.Lock()
+        # One worker is enough: suggestions are CPU-bound and get_similar already splits its own work
+        self._executor: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.set_text(text)
+
+    def set_text(self, text: str) -> List[Token]:
+        """
+        Replaces the whole text and re-checks it. Words that were checked before are answered from memory.
+
+        Args:
+            text (str): New text.
+
+        Returns:
+            List[Token]: The misspelled words as (word, start, end).
+
+        Raises:
+            None
+        """
+        return self.replace(0, len(self.text), text)
+
+    def insert(self, offset: int, text: str) -> List[Token]:
+        """
+        Inserts text at an offset.
+
+        Args:
+            offset (int): Offset to insert at.
+            text (str): Text to insert.
+
+        Returns:
+            List[Token]: The misspelled words among the re-checked ones, as (word, start, end).
+
+        Raises:
+            ValueError: If the offset is outside the text.
+        """
+        return self.replace(offset, 0, text)
+
+    def delete(self, offset: int, length: int) -> List[Token]:
+        """
+        Deletes text at an offset.
+
+        Args:
+            offset (int): Offset to delete at.
+            length (int): Number of characters to delete.
+
+        Returns:
+            List[Token]: The misspelled words among the re-checked ones, as (word, start, end).
+
+        Raises:
+            ValueError: If the range is outside the text.
+        """
+        return self.replace(offset, length, "")
+
+    def replace(self, offset: int, length: int, text: str) -> List[Token]:
+        """
+        Replaces a range of the text. Only the words overlapping or touching the range are re-tokenized and re-checked. The words after it are only moved.
+
+        Args:
+            offset (int): Start of the range.
+            length (int): Length of the range.
+            text (str): Text to put in place of the range.
+
+        Returns:
+            List[Token]: The misspelled words among the re-checked ones, as (word, start, end).
+
+        Raises:
+            ValueError: If the range is outside the text.
+        """
+        if offset < 0 or length < 0 or offset + length > len(self.text):
+            raise ValueError("Edit range is outside the text.")
+        end: int = offset + length
+        delta: int = len(text) - length
+
+        # Words touching the range, plus one character of margin on both sides: a single
+        # apostrophe between two words can join them once the range changes. Only the blocks
+        # holding them (or the block the new words go into) are taken apart.
+        block_count: int = len(self._blocks)
+        first_block: int = max(0, min(self._first_block_ending_at(offset - 1), block_count - 1))
+        last_block: int = min(block_count, max(self._count_blocks_starting_by(end + 1), first_block + 1))
+        tokens: List[Token] = []
+        for block in range(first_block, last_block):
+            tokens.extend(self._absolute(block))
+        first: int = bisect.bisect_left([stop for _, _, stop in tokens], offset - 1)
+        last: int = bisect.bisect_right([start for _, start, _ in tokens], end + 1)
+        region_start: int = min(offset, tokens[first][1]) if first < last else offset
+        region_end: int = max(end, tokens[last - 1][2]) if first < last else end
+
+        self.text = self.text[:offset] + text + self.text[end:]
+
+        new_tokens: List[Token] = [(word, start + region_start, stop + region_start) for word, start, stop in self._tokenizer.tokenize(self.text[region_start:region_end + delta])]
+        self._count_words(tokens[first:last], new_tokens)
+        tail: List[Token] = tokens[last:]
+        if delta:
+            tail = [(word, start + delta, stop + delta) for word, start, stop in tail]
+        self._set_blocks(first_block, last_block, tokens[:first] + new_tokens + tail, delta)
+
+        return [token for token in new_tokens if not self._check(token[0])]
+
+    def _shift(self, block: int) -> int:
+        # Added to the offsets stored in the block
+        tree: List[int] = self._shift_tree
+        shift: int = 0
+        i: int = block + 1
+        while i > 0:
+            shift += tree[i]
+            i -= i & -i
+        return shift
+
+    def _move_blocks(self, block: int, delta: int) -> None:
+        # Adds delta to the shift of the block and of every block after it
+        tree: List[int] = self._shift_tree
+        i: int = block + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _absolute(self, block: int) -> List[Token]:
+        shift: int = self._shift(block)
+        if not shift:
+            return list(self._blocks[block])
+        return [(word, start + shift, stop + shift) for word, start, stop in self._blocks[block]]
+
+    def _first_block_ending_at(self, offset: int) -> int:
+        # First block whose last word ends at or after offset, or the number of blocks if there's none
+        low: int = 0
+        high: int = len(self._blocks)
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._block_ends[middle][-1] + self._shift(middle) < offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _count_blocks_starting_by(self, offset: int) -> int:
+        # Number of blocks whose first word starts at or before offset
+        low: int = 0
+        high: int = len(self._blocks)
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._block_starts[middle][0] + self._shift(middle) <= offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _set_blocks(self, first: int, last: int, tokens: List[Token], delta: int) -> None:
+        # Puts tokens (with absolute offsets) in place of blocks first to last (exclusive), and moves
+        # the blocks after them by delta. Usually that's one block, which keeps its shift. Otherwise
+        # the blocks are rebuilt, and so is the tree, which is proportional to the number of blocks
+        # but only happens once every BLOCK_SIZE or so new words.
+        if last - first == 1 and 0 < len(tokens) <= 2 * BLOCK_SIZE:
+            shift: int = self._shift(first)
+            if shift:
+                tokens = [(word, start - shift, stop - shift) for word, start, stop in tokens]
+            self._blocks[first] = tokens
+            self._block_starts[first] = [start for _, start, _ in tokens]
+            self._block_ends[first] = [stop for _, _, stop in tokens]
+            self._move_blocks(last, delta)
+            return
+        shifts: List[int] = [self._shift(block) for block in range(len(self._blocks))]
+        # New blocks hold absolute offsets, so their shift is 0
+        blocks: List[List[Token]] = [tokens[i:i + BLOCK_SIZE] for i in range(0, len(tokens), BLOCK_SIZE)]
+        self._blocks[first:last] = blocks
+        self._block_starts[first:last] = [[start for _, start, _ in block] for block in blocks]
+        self._block_ends[first:last] = [[stop for _, _, stop in block] for block in blocks]
+        shifts[first:last] = [0] * len(blocks)
+        for block in range(first + len(blocks), len(shifts)):
+            shifts[block] += delta
+        tree: List[int] = [0] + [shift - previous for previous, shift in zip([0] + shifts, shifts)]
+        for i in range(1, len(tree)):
+            parent: int = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._shift_tree = tree
+
+    def _count_words(self, removed: List[Token], added: List[Token]) -> None:
+        # Only the re-tokenized words change, so this stays proportional to the edit
+        gone: List[str] = []
+        with self._lock:
+            for word, _, _ in added:
+                self._counts[word] = self._counts.get(word, 0) + 1
+            for word, _, _ in removed:
+                count: int = self._counts[word] - 1
+                if count:
+                    self._counts[word] = count
+                else:
+                    del self._counts[word]
+                    # Forgotten too, so a session of typing doesn't keep every prefix it went through
+                    self._correct.pop(word, None)
+                    gone.append(word)
+            # Words typed one key at a time ("qu", "qui", ...) are only in the text for a moment, so
+            # their searches are cancelled before they pile up behind the one that's running
+            for word in gone:
+                future: Optional[concurrent.futures.Future] = self._suggestions.pop(word, None)
+                if future is not None:
+                    future.cancel()
+
+    def _check(self, word: str) -> bool:
+        correct: Optional[bool] = self._correct.get(word)
+        if correct is None:
+            correct = self.proofreader.is_correct(word)
+            self._correct[word] = correct
+        if not correct:
+            self._request_suggestions(word)
+        return correct
+
+    def _request_suggestions(self, word: str) -> None:
+        with self._lock:
+            if word in self._suggestions:
+                return
+            future: concurrent.futures.Future = self._executor.submit(self.proofreader.get_similar, word, self._similarity_rate, upto=self._upto, timeout=self._timeout)
+            self._suggestions[word] = future
+        if self.on_suggestions is not None:
+            future.add_done_callback(lambda done: self._deliver(word, done))
+
+    def _deliver(self, word: str, future: concurrent.futures.Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            # The word may have been edited away while its search was running
+            if self._suggestions.get(word) is not future:
+                return
+        self.on_suggestions(word, future.result())
+
+    def tokens(self) -> List[Token]:
+        """
+        Returns all words of the text with their offsets.
+
+        Args:
+            None
+
+        Returns:
+            List[Token]: (word, start, end) for every word.
+
+        Raises:
+            None
+        """
+        tokens: List[Token] = []
+        for block in range(len(self._blocks)):
+            tokens.extend(self._absolute(block))
+        return tokens
+
+    def misspelled(self) -> List[Token]:
+        """
+        Returns the misspelled words of the text with their offsets. Uses the memoised results, so nothing is looked up again.
+
+        Args:
+            None
+
+        Returns:
+            List[Token]: (word, start, end) for every misspelled word.
+
+        Raises:
+            None
+        """
+        return [token for token in self.tokens() if not self._correct[token[0]]]
+
+    def suggestions(self, word: str, wait: bool = False) -> Optional[List[str]]:
+        """
+        Returns the suggestions for a misspelled word. Suggestions are computed for the misspelled words of the current text only: when a word is edited away, its search is cancelled (if it hasn't started yet) and forgotten.
+
+        Args:
+            word (str): Misspelled word, as returned by misspelled.
+            wait (bool): Whether to wait for the suggestions if they're still being computed. Defaults to False.
+
+        Returns:
+            List[str]: List of suggestions.
+            or None if there are no suggestions, or they're not ready yet and wait is False.
+
+        Raises:
+            KeyError: If the word isn't a misspelled word of the text.
+        """
+        with self._lock:
+            future: concurrent.futures.Future = self._suggestions[word]
+        if not wait and not future.done():
+            return None
+        return future.result()
+
+    def close(self) -> None:
+        """
+        Stops computing suggestions in the background. Suggestions that haven't started yet are cancelled.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            for future in self._suggestions.values():
+                future.cancel()
+        self._executor.shutdown(wait=False)
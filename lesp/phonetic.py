@@ -0,0 +1,299 @@
+"""
+Phonetic keys and a phonetic index, for finding words that sound like a misspelling ("fizzix" -> "physics") even when they're far apart by edit distance.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import hashlib
+import mmap
+import os
+import struct
+
+VOWELS: str = "aeiou"
+FRONT_VOWELS: str = "eiy"
+
+# File layout:
+#   header       - magic (8 bytes) + key count, entry count and word count (uint32 each) + size (uint64)
+#                  and modification time (double) of the wordlist file, both 0 if unknown + word order
+#                  fingerprint (8 bytes)
+#   key offsets  - key count + 1 uint32 byte offsets into the key blob
+#   ranges       - key count + 1 uint32 offsets into the entries, the words of key i are entries[ranges[i]:ranges[i + 1]]
+#   entries      - entry count uint32 positions of words in the wordlist, grouped by key
+#   keys         - ASCII keys, sorted
+MAGIC: bytes = b"LESPPHN2"
+HEADER: struct.Struct = struct.Struct("<8sIIIQd8s")
+UINT32: struct.Struct = struct.Struct("<I")
+
+
+def metaphone(word: str) -> str:
+    """
+    Calculates a phonetic key for a word, using a simplified version of Lawrence Philips' Metaphone algorithm. Words that sound alike get the same key, for example "physics" and "fizzix" both become "FSKS", and "knowledge" and "nolege" both become "NLJ".
+
+    Args:
+        word (str): Word to encode.
+
+    Returns:
+        str: Phonetic key (uppercase). Empty if the word has no letters.
+
+    Raises:
+        None
+    """
+    word = "".join(char for char in word.lower() if "a" <= char <= "z")
+    if not word:
+        return ""
+
+    # Silent or changed first letters
+    if word[:2] in ("kn", "gn", "pn", "ps", "ae", "wr"):
+        word = word[1:]
+    elif word[0] == "x":
+        word = "s" + word[1:]
+    elif word[:2] == "wh":
+        word = "w" + word[2:]
+
+    key: List[str] = []
+    length: int = len(word)
+    for i, char in enumerate(word):
+        previous: str = word[i - 1] if i > 0 else ""
+        following: str = word[i + 1] if i + 1 < length else ""
+        after: str = word[i + 2] if i + 2 < length else ""
+
+        # Double letters sound like one, except "cc" ("accept")
+        if char == previous and char != "c":
+            continue
+
+        if char in VOWELS:
+            if i == 0:
+                key.append(char.upper())
+        elif char == "b":
+            if not (previous == "m" and i == length - 1):
+                key.append("B")
+        elif char == "c":
+            if following == "i" and after == "a" or following == "h" and previous != "s":
+                key.append("X")
+            elif following in FRONT_VOWELS and following:
+                if previous != "s":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif char == "d":
+            if following == "g" and after in FRONT_VOWELS and after:
+                key.append("J")
+            else:
+                key.append("T")
+        elif char == "g":
+            # Silent "gh" at the end or before a consonant ("though", "night")
+            if following == "h" and (not after or after not in VOWELS):
+                continue
+            if previous == "d" and following in FRONT_VOWELS and following:
+                continue
+            if following == "n" and (i + 2 == length or word[i + 2:] == "ed"):
+                continue
+            key.append("J" if following in FRONT_VOWELS and following else "K")
+        elif char == "h":
+            if previous in "cgpst" and previous:
+                continue
+            if previous in VOWELS and previous and (not following or following not in VOWELS):
+                continue
+            key.append("H")
+        elif char == "k":
+            if previous != "c":
+                key.append("K")
+        elif char == "p":
+            key.append("F" if following == "h" else "P")
+        elif char == "q":
+            key.append("KW" if following == "u" else "K")
+        elif char == "s":
+            if following == "h" or following == "i" and after in ("o", "a") and after:
+                key.append("X")
+            else:
+                key.append("S")
+        elif char == "t":
+            if following == "i" and after in ("o", "a") and after:
+                key.append("X")
+            elif following == "h":
+                key.append("0")
+            elif not (following == "c" and after == "h"):
+                key.append("T")
+        elif char == "v":
+            key.append("F")
+        elif char in "wy":
+            if following in VOWELS and following:
+                key.append(char.upper())
+        elif char == "x":
+            key.append("KS")
+        elif char == "z":
+            key.append("S")
+        else:
+            # f, j, l, m, n, r sound like themselves
+            key.append(char.upper())
+    return "".join(key)
+
+
+def _fingerprint(words: Sequence[str]) -> bytes:
+    # Positions are only valid for the same words in the same order, so a sample of words spread
+    # over the wordlist is hashed. Checking every word would make loading as slow as building.
+    count: int = len(words)
+    sample: List[str] = [words[i * count // 64] for i in range(64)] if count else []
+    return hashlib.blake2b("\n".join(sample).encode("utf-8"), digest_size=8).digest()
+
+
+class PhoneticIndex:
+    """
+    PhoneticIndex - Maps phonetic keys to the words that have them, so words that sound like a misspelling can be found with a binary search. The index only stores positions of words in the wordlist (4 bytes per word), not the words themselves, and a saved index is memory-mapped, so loading it is instant and processes share its pages.
+
+    Args:
+        words (Sequence[str]): Wordlist the index was built from.
+        data (Union[bytes, mmap.mmap]): The index, in the file format.
+
+    Raises:
+        ValueError: If the data is not a valid phonetic index.
+
+    Methods:
+        build: Builds an index from a list of words.
+        load: Loads an index from a file.
+        save: Saves the index to a file.
+        lookup: Returns the words that sound like a word.
+    """
+    def __init__(self, words: Sequence[str], data: Union[bytes, mmap.mmap]) -> None:
+        if len(data) < HEADER.size:
+            raise ValueError("Invalid phonetic index format. The file is too short.")
+        magic, key_count, entry_count, word_count, _, _, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Invalid phonetic index format. Wrong file signature.")
+        self._words: Sequence[str] = words
+        self._data: Union[bytes, mmap.mmap] = data
+        self._key_count: int = key_count
+        self._key_offsets: int = HEADER.size
+        self._ranges: int = self._key_offsets + (key_count + 1) * UINT32.size
+        self._entries: int = self._ranges + (key_count + 1) * UINT32.size
+        self._keys: int = self._entries + entry_count * UINT32.size
+        if len(data) < self._keys or word_count != len(words):
+            raise ValueError("Invalid phonetic index format.")
+
+    @staticmethod
+    def build(words: Sequence[str]) -> "PhoneticIndex":
+        """
+        Builds an index from a list of words.
+
+        Args:
+            words (Sequence[str]): Words to index. The index refers to them by position, so the list must not change afterwards.
+
+        Returns:
+            PhoneticIndex: The new index.
+
+        Raises:
+            None
+        """
+        groups: Dict[str, List[int]] = {}
+        for position, word in enumerate(words):
+            key: str = metaphone(word)
+            if key:
+                groups.setdefault(key, []).append(position)
+        keys: List[str] = sorted(groups)
+        key_offsets: List[int] = [0]
+        ranges: List[int] = [0]
+        entries: List[int] = []
+        for key in keys:
+            key_offsets.append(key_offsets[-1] + len(key))
+            entries.extend(groups[key])
+            ranges.append(len(entries))
+        data: bytes = b"".join((
+            HEADER.pack(MAGIC, len(keys), len(entries), len(words), 0, 0.0, _fingerprint(words)),
+            struct.pack(f"<{len(key_offsets)}I", *key_offsets),
+            struct.pack(f"<{len(ranges)}I", *ranges),
+            struct.pack(f"<{len(entries)}I", *entries),
+            "".join(keys).encode("ascii"),
+        ))
+        return PhoneticIndex(words, data)
+
+    @staticmethod
+    def load(path: str, words: Sequence[str], source: Optional[dict] = None) -> "PhoneticIndex":
+        """
+        Loads an index from a file written by save. The file is memory-mapped, not read.
+
+        Args:
+            path (str): Path to the index file.
+            words (Sequence[str]): Wordlist the index was built from, in the same order.
+            source (dict): If given, the index must have been saved with the same source ({"size", "mtime"}), otherwise it's considered out of date. Defaults to None.
+
+        Returns:
+            PhoneticIndex: The loaded index.
+
+        Raises:
+            FileNotFoundError: If the index file is not found.
+            ValueError: If the index file is not in the correct format, or doesn't match the words or the source.
+        """
+        try:
+            with open(path, "rb") as f:
+                try:
+                    data: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    raise ValueError("Invalid phonetic index format. The file is empty.")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{path} not found!")
+        index: PhoneticIndex = PhoneticIndex(words, data)
+        _, _, _, _, source_size, source_mtime, fingerprint = HEADER.unpack_from(data, 0)
+        if source is not None and (source["size"], source["mtime"]) != (source_size, source_mtime):
+            raise ValueError("Phonetic index is out of date.")
+        if fingerprint != _fingerprint(words):
+            raise ValueError("Phonetic index was built from different words.")
+        return index
+
+    def save(self, path: str, source: Optional[dict] = None) -> None:
+        """
+        Saves the index to a file.
+
+        Args:
+            path (str): Path to the index file.
+            source (dict): Description of what the index was built from ({"size", "mtime"} of the wordlist file), checked by load. Defaults to None.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        source = source or {"size": 0, "mtime": 0.0}
+        magic, key_count, entry_count, word_count, _, _, fingerprint = HEADER.unpack_from(self._data, 0)
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(magic, key_count, entry_count, word_count, source["size"], source["mtime"], fingerprint))
+            f.write(self._data[HEADER.size:])
+        os.replace(temp_path, path)
+
+    def _key(self, index: int) -> bytes:
+        start, end = struct.unpack_from("<2I", self._data, self._key_offsets + index * UINT32.size)
+        return self._data[self._keys + start:self._keys + end]
+
+    def lookup(self, word: str) -> List[str]:
+        """
+        Returns the words that sound like a word.
+
+        Args:
+            word (str): Word to look up.
+
+        Returns:
+            List[str]: Words with the same phonetic key. Empty if there are none.
+
+        Raises:
+            None
+        """
+        target: bytes = metaphone(word).encode("ascii")
+        low: int = 0
+        high: int = self._key_count
+        while low < high:
+            middle: int = (low + high) // 2
+            current: bytes = self._key(middle)
+            if current == target:
+                start, end = struct.unpack_from("<2I", self._data, self._ranges + middle * UINT32.size)
+                positions: Tuple[int, ...] = struct.unpack_from(f"<{end - start}I", self._data, self._entries + start * UINT32.size)
+                return [self._words[position] for position in positions]
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle
+        return []
+
+    def __len__(self) -> int:
+        return self._key_count
@@ -0,0 +1,352 @@
+"""
+Read-only wordlists stored in a single memory-mapped file. The file is built once (usually by the parent process) and every Proofreader that attaches to it reads the same pages from the OS page cache, so pre-fork workers don't each keep their own copy of the dictionary.
+"""
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+import array
+import collections.abc
+import mmap
+import os
+import struct
+import sys
+
+# File layout:
+#   header       - magic (8 bytes) + word count (uint32) + flags (uint32) + size (uint64) and
+#                  modification time (double) of the wordlist file the index was built from, both 0 if unknown
+#   offsets      - count + 1 uint32 byte offsets into the word blob
+#   frequencies  - only with FLAG_FREQUENCIES: count uint64 frequencies, in word order
+#   order        - only with FLAG_FREQUENCIES: count uint32 word positions, most frequent first
+#   length count - uint32, the longest word length (in characters) + 2
+#   length starts - length count uint32 indexes into the by-length positions, where the words of length L
+#                  are positions[starts[L]:starts[L + 1]]
+#   by length    - count uint32 word positions sorted by length, and by position within a length
+#   blob         - UTF-8 words sorted by their encoded bytes, each followed by "\n"
+MAGIC: bytes = b"LESPIDX4"
+HEADER: struct.Struct = struct.Struct("<8sIIQd")
+OFFSET: struct.Struct = struct.Struct("<I")
+FREQUENCY: struct.Struct = struct.Struct("<Q")
+POSITION: struct.Struct = struct.Struct("<I")
+FLAG_FREQUENCIES: int = 1
+
+
+class _PackedArray(collections.abc.Sequence):
+    # Read-only view of an array of packed integers inside a memory-mapped file
+    def __init__(self, buffer: mmap.mmap, start: int, count: int, item: struct.Struct) -> None:
+        self._buffer: mmap.mmap = buffer
+        self._start: int = start
+        self._count: int = count
+        self._item: struct.Struct = item
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("Packed array index out of range.")
+        return self._item.unpack_from(self._buffer, self._start + index * self._item.size)[0]
+
+
+class WordlistView(collections.abc.Sequence):
+    """
+    WordlistView - A read-only sequence of words taken from a wordlist by position, for example the words of a shared index in order of frequency. Holds only the positions, the words are read from the wordlist when they're accessed.
+
+    Args:
+        words (Sequence[str]): Wordlist to take the words from.
+        positions (Sequence[int]): Positions of the words in the wordlist, in the order of the view.
+
+    Raises:
+        None
+    """
+    def __init__(self, words: Sequence[str], positions: Sequence[int]) -> None:
+        self._words: Sequence[str] = words
+        self._positions: Sequence[int] = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self._words[position] for position in self._positions[index]]
+        return self._words[self._positions[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        words: Sequence[str] = self._words
+        for position in self._positions:
+            yield words[position]
+
+
+class SharedFrequencies(collections.abc.Mapping):
+    """
+    SharedFrequencies - Read-only word to frequency mapping stored in a shared index, so attaching processes get the frequencies of the wordlist without a per-word Python object. Words without a frequency behave as missing keys.
+
+    Args:
+        wordlist (SharedWordlist): Shared wordlist the frequencies belong to.
+        frequencies (Sequence[int]): Frequency of every word, in word order.
+
+    Raises:
+        None
+    """
+    def __init__(self, wordlist: "SharedWordlist", frequencies: Sequence[int]) -> None:
+        self._wordlist: SharedWordlist = wordlist
+        self._frequencies: Sequence[int] = frequencies
+        self._length: Optional[int] = None
+
+    def __getitem__(self, word: str) -> int:
+        index: int = self._wordlist._find(word)
+        frequency: int = self._frequencies[index] if index >= 0 else 0
+        if not frequency:
+            raise KeyError(word)
+        return frequency
+
+    def __iter__(self) -> Iterator[str]:
+        for word, frequency in zip(self._wordlist, self._frequencies):
+            if frequency:
+                yield word
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = sum(1 for frequency in self._frequencies if frequency)
+        return self._length
+
+    def __bool__(self) -> bool:
+        # Only created for indexes with frequencies, so no need to count them
+        return True
+
+
+class SharedWordlist:
+    """
+    SharedWordlist - A read-only, sorted wordlist backed by a memory-mapped file. Behaves like a list of words for reading (len, iteration, indexing, slicing and "in"), but holds no per-word Python objects.
+
+    Args:
+        path (str): Path to the shared index file. Build it with SharedWordlist.build first.
+
+    Attributes:
+        path (str): Path to the shared index file.
+        source (dict): Size and modification time ({"size", "mtime"}) of the wordlist file the index was built from, or None if unknown.
+        frequencies (SharedFrequencies): Word frequencies stored in the index, or None.
+        max_length (int): Length (in characters) of the longest word, -1 if there are no words.
+
+    Raises:
+        FileNotFoundError: If the shared index file is not found.
+        ValueError: If the file is not a valid shared index.
+
+    Methods:
+        build: Writes a shared index file from a list of words.
+        by_frequency: Returns the words from most to least frequent.
+        by_length: Returns the positions of the words of a given length.
+        close: Unmaps the shared index file.
+    """
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        try:
+            self._file = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{path} not found!")
+        try:
+            self._mmap: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Invalid shared index format. The file is empty.")
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError("Invalid shared index format. The file is too short.")
+        magic, count, flags, source_size, source_mtime = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Invalid shared index format. Wrong file signature.")
+        self.source: Optional[dict] = {"size": source_size, "mtime": source_mtime} if source_size or source_mtime else None
+        self._count: int = count
+        position: int = HEADER.size + (count + 1) * OFFSET.size
+        self.frequencies: Optional[SharedFrequencies] = None
+        self._order: Optional[_PackedArray] = None
+        if flags & FLAG_FREQUENCIES:
+            self.frequencies = SharedFrequencies(self, _PackedArray(self._mmap, position, count, FREQUENCY))
+            position += count * FREQUENCY.size
+            self._order = _PackedArray(self._mmap, position, count, POSITION)
+            position += count * POSITION.size
+        length_count: int = POSITION.unpack_from(self._mmap, position)[0]
+        self.max_length: int = length_count - 2
+        self._length_starts: _PackedArray = _PackedArray(self._mmap, position + POSITION.size, length_count, POSITION)
+        position += (1 + length_count) * POSITION.size
+        self._by_length_start: int = position
+        position += count * POSITION.size
+        self._words_start: int = position
+
+    @staticmethod
+    def build(words: Iterable[str], path: str, source: Optional[dict] = None, frequencies: Optional[Mapping[str, int]] = None) -> None:
+        """
+        Writes a shared index file. The file is written next to the destination first and then moved into place, so processes attaching at the same time never see a half-written index.
+
+        Args:
+            words (Iterable[str]): Words to store. Duplicates are removed.
+            path (str): Path to the shared index file.
+            source (dict): Size and modification time ({"size", "mtime"}) of the wordlist file the words come from, so attaching processes can tell whether the index is out of date. Defaults to None (unknown).
+            frequencies (Mapping[str, int]): Word frequencies to store along with the words, so attaching processes can rank by frequency without loading them. Defaults to None (no frequencies).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        encoded: List[bytes] = sorted(set(word.encode("utf-8") for word in words))
+        offsets: List[int] = [0]
+        for word in encoded:
+            offsets.append(offsets[-1] + len(word) + 1)
+
+        flags: int = 0
+        if frequencies:
+            flags |= FLAG_FREQUENCIES
+            counts: List[int] = [frequencies.get(word.decode("utf-8"), 0) for word in encoded]
+            # sorted is stable, so words with the same frequency stay in word order
+            order: List[int] = sorted(range(len(encoded)), key=lambda i: -counts[i])
+        # Lengths in characters, the same as len() of the decoded words
+        lengths: List[int] = [len(word.decode("utf-8")) for word in encoded]
+        by_length: List[int] = sorted(range(len(encoded)), key=lengths.__getitem__)
+        length_starts: List[int] = [0] * (max(lengths, default=-1) + 2)
+        for length in lengths:
+            length_starts[length + 1] += 1
+        for length in range(1, len(length_starts)):
+            length_starts[length] += length_starts[length - 1]
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            source = source or {"size": 0, "mtime": 0.0}
+            f.write(HEADER.pack(MAGIC, len(encoded), flags, source["size"], source["mtime"]))
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            if flags & FLAG_FREQUENCIES:
+                f.write(struct.pack(f"<{len(counts)}Q", *counts))
+                f.write(struct.pack(f"<{len(order)}I", *order))
+            f.write(struct.pack(f"<{len(length_starts) + 1}I", len(length_starts), *length_starts))
+            f.write(struct.pack(f"<{len(by_length)}I", *by_length))
+            for word in encoded:
+                f.write(word)
+                f.write(b"\n")
+        os.replace(temp_path, path)
+
+    def by_frequency(self) -> Optional[WordlistView]:
+        """
+        Returns the words from most to least frequent, using the order stored in the index.
+
+        Args:
+            None
+
+        Returns:
+            WordlistView: The words from most to least frequent.
+            or None if the index has no frequencies.
+
+        Raises:
+            None
+        """
+        if self._order is None:
+            return None
+        return WordlistView(self, self._order)
+
+    def by_length(self, length: int) -> array.array:
+        """
+        Returns the positions of the words with a given number of characters, in word order (so words sharing a first letter are next to each other). The positions are copied out of the index in one go.
+
+        Args:
+            length (int): Number of characters.
+
+        Returns:
+            array.array: Positions of the words, as unsigned ints. Empty if no word has that length.
+
+        Raises:
+            None
+        """
+        positions: array.array = array.array("I")
+        if length < 0 or length > self.max_length:
+            return positions
+        start: int = self._by_length_start + self._length_starts[length] * POSITION.size
+        stop: int = self._by_length_start + self._length_starts[length + 1] * POSITION.size
+        positions.frombytes(self._mmap[start:stop])
+        if sys.byteorder == "big":
+            positions.byteswap()
+        return positions
+
+    def close(self) -> None:
+        """
+        Unmaps the shared index file. The object can't be used afterwards.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._mmap.close()
+        self._file.close()
+
+    def _offset(self, index: int) -> int:
+        return self._words_start + OFFSET.unpack_from(self._mmap, HEADER.size + index * OFFSET.size)[0]
+
+    def _raw(self, index: int) -> bytes:
+        # Without the trailing newline
+        return self._mmap[self._offset(index):self._offset(index + 1) - 1]
+
+    def _range(self, start: int, stop: int) -> List[str]:
+        if start >= stop:
+            return []
+        # One decode for the whole range is a lot cheaper than decoding word by word
+        blob: bytes = self._mmap[self._offset(start):self._offset(stop) - 1]
+        return blob.decode("utf-8").split("\n")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return self._range(start, stop)
+            return [self._raw(i).decode("utf-8") for i in range(start, stop, step)]
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("Shared wordlist index out of range.")
+        return self._raw(index).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        # Decode in blocks so iterating doesn't materialize the whole wordlist at once
+        block: int = 4096
+        for start in range(0, self._count, block):
+            yield from self._range(start, min(start + block, self._count))
+
+    def _find(self, word: object) -> int:
+        # Binary search, returns the position of the word or -1
+        if not isinstance(word, str):
+            return -1
+        target: bytes = word.encode("utf-8")
+        low: int = 0
+        high: int = self._count
+        while low < high:
+            middle: int = (low + high) // 2
+            current: bytes = self._raw(middle)
+            if current == target:
+                return middle
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def __contains__(self, word: object) -> bool:
+        return self._find(word) >= 0
+
+    def __reduce__(self) -> tuple:
+        # Pickle by path, so worker processes map the same file instead of receiving a copy
+        return (SharedWordlist, (self.path,))
+
+    def append(self, word: str) -> None:
+        raise TypeError("Shared wordlists are read-only.")
+
+    def remove(self, word: str) -> None:
+        raise TypeError("Shared wordlists are read-only.")
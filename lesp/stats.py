@@ -0,0 +1,122 @@
+"""
+Thread-safe counters and timers used by Proofreader when instrumentation is turned on.
+"""
+from typing import Dict, List
+import threading
+
+
+class Stats:
+    """
+    Stats - A thread-safe collection of counters and timers. Workers running on the executor can update the same object at the same time.
+
+    Args:
+        None
+
+    Methods:
+        increment: Adds to a counter.
+        record: Records a duration for a timer.
+        merge: Adds the counters and timers of another Stats object.
+        snapshot: Returns a copy of the counters and timers.
+        reset: Clears all counters and timers.
+    """
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        # name -> [count, total seconds, max seconds]
+        self._timers: Dict[str, List[float]] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): Name of the counter.
+            amount (int): Amount to add. Defaults to 1.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Records a duration for a timer.
+
+        Args:
+            name (str): Name of the timer.
+            seconds (float): Duration in seconds.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            timer: List[float] = self._timers.setdefault(name, [0, 0.0, 0.0])
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def merge(self, other: "Stats") -> None:
+        """
+        Adds the counters and timers of another Stats object to this one.
+
+        Args:
+            other (Stats): Stats object to merge in.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        snapshot: dict = other.snapshot()
+        with self._lock:
+            for name, value in snapshot["counters"].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+            for name, value in snapshot["timers"].items():
+                timer: List[float] = self._timers.setdefault(name, [0, 0.0, 0.0])
+                timer[0] += value["count"]
+                timer[1] += value["total_seconds"]
+                timer[2] = max(timer[2], value["max_seconds"])
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of the counters and timers.
+
+        Args:
+            None
+
+        Returns:
+            dict: {"counters": {name: value}, "timers": {name: {"count", "total_seconds", "max_seconds"}}}
+
+        Raises:
+            None
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timers": {name: {"count": int(timer[0]), "total_seconds": timer[1], "max_seconds": timer[2]} for name, timer in self._timers.items()},
+            }
+
+    def reset(self) -> None:
+        """
+        Clears all counters and timers.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._lock:
+            self._counters = {}
+            self._timers = {}
@@ -0,0 +1,134 @@
+"""
+Single-pass tokenizer that splits text into words for spell checking, with the offsets of every word in the original text.
+"""
+from typing import Iterator, List, Tuple
+import re
+
+# Any Unicode letter: a word character that isn't a digit or an underscore
+LETTERS: str = r"[^\W\d_]"
+LETTERS_AND_DIGITS: str = r"[^\W_]"
+APOSTROPHES: str = "'’"
+
+
+class Tokenizer:
+    """
+    Tokenizer - Splits text into words with one compiled regular expression, so the whole text is scanned once. Everything that isn't a letter (punctuation, symbols, whitespace, and by default digits) separates words, Unicode punctuation included.
+
+    Args:
+        lowercase (bool): Whether to lowercase the words. Defaults to True.
+        apostrophes (str): What to do with apostrophes inside words: "remove" joins the parts ("don't" -> "dont"), "keep" keeps them ("don't"), and "split" makes separate words ("don", "t"). Defaults to "remove".
+        keep_digits (bool): Whether digits are part of words ("mp3") instead of separating them ("mp"). Defaults to False.
+
+    Attributes:
+        lowercase (bool): Whether the words are lowercased.
+        apostrophes (str): How apostrophes inside words are handled.
+        keep_digits (bool): Whether digits are part of words.
+
+    Raises:
+        ValueError: If apostrophes is not "remove", "keep" or "split".
+
+    Methods:
+        tokenize: Returns the words of a text with their offsets.
+        iter_tokens: Same as tokenize, but yields the words one by one.
+        words: Returns only the words of a text, without offsets.
+    """
+    def __init__(self, lowercase: bool = True, apostrophes: str = "remove", keep_digits: bool = False) -> None:
+        if apostrophes not in ("remove", "keep", "split"):
+            raise ValueError("apostrophes must be \"remove\", \"keep\" or \"split\".")
+        self.lowercase: bool = lowercase
+        self.apostrophes: str = apostrophes
+        self.keep_digits: bool = keep_digits
+
+        part: str = (LETTERS_AND_DIGITS if keep_digits else LETTERS) + "+"
+        if apostrophes == "split":
+            self._pattern = re.compile(part)
+        else:
+            self._pattern = re.compile(f"{part}(?:[{APOSTROPHES}]{part})*")
+        self._strip_apostrophes: dict = str.maketrans("", "", APOSTROPHES) if apostrophes == "remove" else {}
+
+    def iter_tokens(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Yields the words of a text one by one, with their offsets.
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            Iterator[Tuple[str, int, int]]: (word, start, end) for every word, where text[start:end] is the word as it appears in the text.
+
+        Raises:
+            None
+        """
+        return self._iter_prepared(*self._prepare(text))
+
+    def _iter_prepared(self, scanned: str, lowercase_words: bool) -> Iterator[Tuple[str, int, int]]:
+        strip: dict = self._strip_apostrophes
+        for match in self._pattern.finditer(scanned):
+            word: str = match.group()
+            if strip and ("'" in word or "’" in word):
+                word = word.translate(strip)
+            if lowercase_words:
+                word = word.lower()
+            yield word, match.start(), match.end()
+
+    def _prepare(self, text: str) -> Tuple[str, bool]:
+        # Lowercasing the whole text at once is a lot cheaper than word by word. Offsets stay
+        # valid as long as the length doesn't change (lower() never removes characters, so
+        # the same length means every character mapped to exactly one character). Otherwise
+        # fall back to lowercasing each word.
+        if not self.lowercase:
+            return text, False
+        lowered: str = text.lower()
+        if len(lowered) == len(text):
+            return lowered, False
+        return text, True
+
+    def tokenize(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Returns the words of a text with their offsets.
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            List[Tuple[str, int, int]]: (word, start, end) for every word, where text[start:end] is the word as it appears in the text.
+
+        Raises:
+            None
+        """
+        scanned, lowercase_words = self._prepare(text)
+        if lowercase_words:
+            return list(self._iter_prepared(scanned, lowercase_words))
+        tokens: List[Tuple[str, int, int]] = [(match.group(), match.start(), match.end()) for match in self._pattern.finditer(scanned)]
+        strip: dict = self._strip_apostrophes
+        if strip and ("'" in scanned or "’" in scanned):
+            # Few words have apostrophes, so only those are rebuilt
+            for i, (word, start, end) in enumerate(tokens):
+                if "'" in word or "’" in word:
+                    tokens[i] = (word.translate(strip), start, end)
+        return tokens
+
+    def words(self, text: str) -> List[str]:
+        """
+        Returns only the words of a text. Faster than tokenize, since there are no offsets to keep track of.
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            List[str]: List of words.
+
+        Raises:
+            None
+        """
+        # Same preparation as tokenize, so both split a text into the same words. Lowercasing the
+        # text first can turn one letter into a letter and a combining mark ("İ"), which the
+        # pattern then splits on.
+        scanned, lowercase_words = self._prepare(text)
+        words: List[str] = self._pattern.findall(scanned)
+        strip: dict = self._strip_apostrophes
+        if strip and ("'" in scanned or "’" in scanned):
+            words = [word.translate(strip) if "'" in word or "’" in word else word for word in words]
+        if lowercase_words:
+            words = [word.lower() for word in words]
+        return words
@@ -0,0 +1,120 @@
+"""
+Offline cache pre-warming. Computes get_similar results for known or likely misspellings on all cores and writes them to a cache file that Proofreader loads as usual, so deployments start with a warm cache.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+import concurrent.futures
+import json
+import os
+import string
+
+from .autocorrect import Proofreader
+
+EDIT_OPERATIONS: tuple = ("delete", "transpose", "substitute", "insert")
+
+# Proofreader of the current worker process, created once by _init_worker
+_worker_proofreader: Optional[Proofreader] = None
+_worker_options: dict = {}
+
+
+def generate_edits(words: Iterable[str], operations: Iterable[str] = ("delete", "transpose"), dictionary: Optional[Set[str]] = None) -> List[str]:
+    """
+    Generates likely misspellings of words with single-character edits.
+
+    Args:
+        words (Iterable[str]): Words to misspell.
+        operations (Iterable[str]): Edits to apply, any of "delete", "transpose", "substitute" and "insert". Substitutions and insertions produce about 26 misspellings per letter, so they're off by default. Defaults to ("delete", "transpose").
+        dictionary (Set[str]): Valid words. Edits that produce a valid word are left out. Defaults to None (keep everything).
+
+    Returns:
+        List[str]: Unique misspellings, in the order they were generated.
+
+    Raises:
+        ValueError: If an operation is not supported.
+    """
+    operations = tuple(operations)
+    for operation in operations:
+        if operation not in EDIT_OPERATIONS:
+            raise ValueError(f"Unknown edit operation: {operation}. Use any of {', '.join(EDIT_OPERATIONS)}.")
+    misspellings: Dict[str, None] = {}
+    for word in words:
+        word = word.lower()
+        edits: List[str] = []
+        if "delete" in operations:
+            edits += [word[:i] + word[i + 1:] for i in range(len(word))]
+        if "transpose" in operations:
+            edits += [word[:i] + word[i + 1] + word[i] + word[i + 2:] for i in range(len(word) - 1)]
+        if "substitute" in operations:
+            edits += [word[:i] + char + word[i + 1:] for i in range(len(word)) for char in string.ascii_lowercase]
+        if "insert" in operations:
+            edits += [word[:i] + char + word[i:] for i in range(len(word) + 1) for char in string.ascii_lowercase]
+        for edit in edits:
+            if edit and edit != word and (dictionary is None or edit not in dictionary):
+                misspellings[edit] = None
+    return list(misspellings)
+
+
+def _init_worker(proofreader_options: dict, options: dict) -> None:
+    global _worker_proofreader, _worker_options
+    _worker_proofreader = Proofreader(cache_file=None, **proofreader_options)
+    _worker_options = options
+
+
+def _suggest(word: str) -> tuple:
+    similar: Optional[List[str]] = _worker_proofreader.get_similar(word, _worker_options["similarity_rate"], chunks=1, upto=_worker_options["upto"])
+    # The cache stores an empty list for words without similar words
+    return word, similar or []
+
+
+def warm_cache(misspellings: Iterable[str], cache_file: str, proofreader_options: dict, similarity_rate: float = 0.5, upto: int = 3, workers: Optional[int] = None, merge: bool = True) -> int:
+    """
+    Computes get_similar for every misspelling in parallel and writes the results to a cache file in the format Proofreader.load_cache expects.
+
+    Args:
+        misspellings (Iterable[str]): Misspellings to compute suggestions for. Anything that isn't a lowercase alphabetic word after lowercasing is skipped, since the cache can't store it.
+        cache_file (str): Path to the cache file.
+        proofreader_options (dict): Keyword arguments for the Proofreader of every worker (wordlist_path, frequency_path, phonetic, shared_index, ...). Passing a shared_index keeps one copy of the wordlist in memory for all workers.
+        similarity_rate (float): Similarity rate between 0 and 1. Defaults to 0.5.
+        upto (int): Number of similar words to store per misspelling. Defaults to 3.
+        workers (int): Number of worker processes. Defaults to the number of CPU cores.
+        merge (bool): Whether to keep the entries already in the cache file. New results replace old ones for the same word. Defaults to True.
+
+    Returns:
+        int: Number of entries computed.
+
+    Raises:
+        ValueError: If upto is less than 1.
+        ValueError: If similarity_rate is not between 0 and 1.
+        ValueError: If the existing cache file is not in the correct format.
+    """
+    if upto < 1:
+        raise ValueError("Can only return 1 or more similar words.")
+    if similarity_rate < 0 or similarity_rate > 1:
+        raise ValueError("Similarity rate must be between 0 and 1.")
+
+    words: List[str] = list(dict.fromkeys(word.strip().lower() for word in misspellings))
+    words = [word for word in words if word.isalpha() and word.islower()]
+
+    cache: dict = {}
+    if merge and os.path.isfile(cache_file):
+        try:
+            with open(cache_file, "r") as f:
+                cache = json.load(f)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid cache file format. Must be a valid JSON file.")
+        Proofreader.validate_cache(cache)
+
+    options: dict = {"similarity_rate": similarity_rate, "upto": upto}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(proofreader_options, options)) as executor:
+        # Bigger chunks mean less back and forth between the processes
+        chunksize: int = max(1, len(words) // ((workers or os.cpu_count() or 1) * 16))
+        for word, similar in executor.map(_suggest, words, chunksize=chunksize):
+            cache[word] = similar
+
+    directory: str = os.path.dirname(cache_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path: str = f"{cache_file}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(cache, f)
+    os.replace(temp_path, cache_file)
+    return len(words)